@@ -4,7 +4,14 @@ News Summarizer Orchestrator Module
 Orchestrates ML pipelines for news data processing and summarization.
 """
 
-from .pipelines import crawl_news_links, generate_training_dataset, process_documents, scrape_news_articles
+from importlib import import_module
 
 __version__ = "1.0.0"
 __all__ = ["crawl_news_links", "scrape_news_articles", "process_documents", "generate_training_dataset"]
+
+
+def __getattr__(name: str):
+    # Pipelines pull in zenml, torch and transformers, so only import them on first access
+    if name in __all__:
+        return getattr(import_module(".pipelines", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
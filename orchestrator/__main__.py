@@ -1,16 +1,46 @@
+import json
 from pathlib import Path
 from typing import List
 
 import typer
 import yaml
-from pipelines import crawl_news_links, generate_training_dataset, process_documents, scrape_news_articles
 
 app = typer.Typer()
 
 
-def read_yaml(file_path: Path) -> List[str]:
+def _load_yaml(file_path: Path) -> dict:
+    """Parse a YAML file, reusing a JSON sidecar cache while the source is unchanged."""
+    cache_path = file_path.with_name(f"{file_path.name}.json")
+    source_stat = file_path.stat()
+    # Match the exact mtime and size so edits that keep or move back the timestamp still invalidate it
+    source = {"mtime_ns": source_stat.st_mtime_ns, "size": source_stat.st_size}
+
+    try:
+        with cache_path.open("r") as file:
+            cached = json.load(file)
+        if cached["source"] == source:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
     with file_path.open("r") as file:
-        data = yaml.safe_load(file)
+        data = yaml.load(file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    try:
+        serialized = json.dumps({"source": source, "data": data})
+        # JSON turns non-string keys into strings, so only cache data that reads back unchanged
+        if json.loads(serialized)["data"] == data:
+            cache_path.write_text(serialized)
+        else:
+            cache_path.unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError):
+        cache_path.unlink(missing_ok=True)
+
+    return data
+
+
+def read_yaml(file_path: Path) -> List[str]:
+    data = _load_yaml(file_path)
     return data.get("parameters", None).get("links", None)
 
 
@@ -21,21 +51,29 @@ def crawl_links(yaml_filepath: Path):
     if links is None:
         return
 
+    from pipelines import crawl_news_links
+
     crawl_news_links(links)
 
 
 @app.command()
 def scrape_content():
+    from pipelines import scrape_news_articles
+
     scrape_news_articles()
 
 
 @app.command()
 def process_content():
+    from pipelines import process_documents
+
     process_documents()
 
 
 @app.command()
 def generate_datasets(dataset_type: str):
+    from pipelines import generate_training_dataset
+
     generate_training_dataset(dataset_type)
 
 
@@ -2,25 +2,42 @@ import logging
 import os
 import time
 from functools import wraps
+from pathlib import Path
 
 import psutil
 
 logger = logging.getLogger(__name__)
 
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+STATM_PATH = Path("/proc/self/statm")
+
+
+def _current_rss(process: psutil.Process) -> int:
+    """Return the resident set size in bytes, reading /proc directly when available."""
+    try:
+        with STATM_PATH.open("rb") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return process.memory_info().rss
+
 
 def resource_usage(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
+        # Probing /proc is not free, so only measure when the report would actually be logged
+        if not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+
         process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
+        start_memory = _current_rss(process)
         start_cpu_percent = process.cpu_percent(interval=None)
         start_cpu_times = process.cpu_times()
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
-        end_memory = process.memory_info().rss
+        end_memory = _current_rss(process)
         end_cpu_percent = process.cpu_percent(interval=None)
         end_cpu_times = process.cpu_times()
 
@@ -1,8 +1,19 @@
 """Pipeline definitions for the orchestrator."""
 
-from .article_extraction import scrape_news_articles
-from .dataset_generation import generate_training_dataset
-from .document_processing import process_documents
-from .link_extraction import crawl_news_links
+from importlib import import_module
+
+_PIPELINE_MODULES = {
+    "crawl_news_links": ".link_extraction",
+    "scrape_news_articles": ".article_extraction",
+    "process_documents": ".document_processing",
+    "generate_training_dataset": ".dataset_generation",
+}
 
 __all__ = ["crawl_news_links", "scrape_news_articles", "process_documents", "generate_training_dataset"]
+
+
+def __getattr__(name: str):
+    # Import a pipeline module only when the pipeline is requested
+    if name in _PIPELINE_MODULES:
+        return getattr(import_module(_PIPELINE_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
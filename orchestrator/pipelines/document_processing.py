@@ -1,6 +1,6 @@
 """Pipeline for processing and indexing documents."""
 
-from steps.processing import clean_articles, load_articles, store_documents, vectorize_articles
+from steps.processing import clean_articles, load_articles, store_processed_documents, vectorize_articles
 from zenml import pipeline
 
 
@@ -11,5 +11,4 @@ def process_documents():
     cleaned_articles = clean_articles(raw_articles)
     embedded_chunks = vectorize_articles(cleaned_articles)
 
-    store_documents(cleaned_articles, id="store_cleaned_articles")
-    store_documents(embedded_chunks, id="store_embedded_chunks")
+    store_processed_documents(cleaned_articles, embedded_chunks)
@@ -1,18 +1,21 @@
 """Step definitions for orchestrator pipelines."""
 
-from .datasets import create_dataset, load_cleaned_articles, upload_to_huggingface
-from .extraction import (
-    crawl_links,
-    remove_duplicate_articles,
-    remove_duplicate_links,
-    scrape_articles,
-)
-from .processing import (
-    clean_articles,
-    load_articles,
-    store_documents,
-    vectorize_articles,
-)
+from importlib import import_module
+
+_STEP_PACKAGES = {
+    "crawl_links": ".extraction",
+    "scrape_articles": ".extraction",
+    "remove_duplicate_links": ".extraction",
+    "remove_duplicate_articles": ".extraction",
+    "load_articles": ".processing",
+    "clean_articles": ".processing",
+    "vectorize_articles": ".processing",
+    "store_documents": ".processing",
+    "store_processed_documents": ".processing",
+    "load_cleaned_articles": ".datasets",
+    "create_dataset": ".datasets",
+    "upload_to_huggingface": ".datasets",
+}
 
 __all__ = [
     "crawl_links",
@@ -23,7 +26,15 @@ __all__ = [
     "clean_articles",
     "vectorize_articles",
     "store_documents",
+    "store_processed_documents",
     "load_cleaned_articles",
     "create_dataset",
     "upload_to_huggingface",
 ]
+
+
+def __getattr__(name: str):
+    # Importing one step package must not drag in the dependencies of the others
+    if name in _STEP_PACKAGES:
+        return getattr(import_module(_STEP_PACKAGES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,8 @@
 """Step for loading cleaned articles for dataset generation."""
 
 import logging
-from typing import List, Optional
+from itertools import chain, islice
+from typing import Iterator, List, Optional
 
 from news_summarizer.domain.clean_documents import CleanedArticle
 from typing_extensions import Annotated
@@ -9,11 +10,14 @@ from zenml import get_step_context, step
 
 logger = logging.getLogger(__name__)
 
+PAGE_SIZE = 256
+
 
 @step
 def load_cleaned_articles(max_documents: Optional[int] = None) -> Annotated[List[CleanedArticle], "cleaned_articles"]:
     """Load cleaned articles with optional limit."""
-    articles = _fetch_cleaned_articles_with_limit(max_documents)
+    # ZenML materializes the step output, so the stream is only collected once here
+    articles = list(_iter_cleaned_articles(max_documents))
 
     metadata = {"loaded_articles": {"count": len(articles)}}
 
@@ -24,25 +28,24 @@ def load_cleaned_articles(max_documents: Optional[int] = None) -> Annotated[List
     return articles
 
 
-def _fetch_cleaned_articles_with_limit(max_documents: Optional[int] = None) -> List[CleanedArticle]:
-    """Fetch cleaned articles with pagination and optional limit."""
+def _iter_cleaned_articles(max_documents: Optional[int] = None) -> Iterator[CleanedArticle]:
+    """Stream cleaned articles one by one, stopping after an optional limit."""
+    articles = chain.from_iterable(_iter_cleaned_article_pages(max_documents))
+    return islice(articles, max_documents)
+
+
+def _iter_cleaned_article_pages(max_documents: Optional[int] = None) -> Iterator[List[CleanedArticle]]:
+    """Scroll through cleaned articles page by page, sizing the last page to the remaining limit."""
     offset = None
-    articles = []
+    loaded = 0
 
-    while True:
-        batch_articles, offset = CleanedArticle.bulk_find(**{}, offset=offset)
+    while max_documents is None or loaded < max_documents:
+        # Ask Qdrant for exactly what is still needed instead of trimming a full page
+        limit = PAGE_SIZE if max_documents is None else min(PAGE_SIZE, max_documents - loaded)
+        batch_articles, offset = CleanedArticle.bulk_find(limit=limit, offset=offset)
 
-        if max_documents is not None:
-            remaining_slots = max_documents - len(articles)
-            if remaining_slots <= 0:
-                break
-            articles.extend(batch_articles[:remaining_slots])
-            if len(articles) >= max_documents:
-                break
-        else:
-            articles.extend(batch_articles)
+        yield batch_articles
+        loaded += len(batch_articles)
 
         if offset is None:
             break
-
-    return articles
@@ -6,6 +6,8 @@ from news_summarizer.config import settings
 from news_summarizer.domain.dataset import PreferenceDataset, SummaryDataset
 from zenml import step
 
+MAX_SHARD_SIZE = "200MB"
+
 
 @step
 def upload_to_huggingface(repository_name: str, dataset: Union[SummaryDataset, PreferenceDataset]):
@@ -14,4 +16,5 @@ def upload_to_huggingface(repository_name: str, dataset: Union[SummaryDataset, P
     hf_dataset.push_to_hub(
         repository_name,
         token=settings.huggingface.access_token.get_secret_value(),
+        max_shard_size=MAX_SHARD_SIZE,
     )
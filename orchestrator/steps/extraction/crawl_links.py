@@ -13,24 +13,36 @@ logger = logging.getLogger(__name__)
 
 
 @step
-def crawl_links(newspaper_urls: list[str]) -> Annotated[Dict[str, str], "crawled_links"]:
-    """Crawl news websites to extract article links."""
-    logger.info("Starting link crawling for %d websites", len(newspaper_urls))
+def crawl_links(
+    newspaper_urls: list[str], max_concurrent_crawlers: int = 4
+) -> Annotated[Dict[str, str], "crawled_links"]:
+    """Crawl news websites concurrently to extract article links."""
+    logger.info(
+        "Starting link crawling for %d websites with %d concurrent crawlers",
+        len(newspaper_urls),
+        max_concurrent_crawlers,
+    )
 
     start_time = time.time()
-    executor = CrawlerExecutor(crawler_registry)
+    executor = CrawlerExecutor(
+        crawler_registry, max_concurrent_crawlers=max_concurrent_crawlers, max_workers=max_concurrent_crawlers
+    )
     results = executor.run(newspaper_urls)
     elapsed_time = timedelta(seconds=time.time() - start_time)
 
     logger.info("Link crawling completed in %s", elapsed_time)
 
-    statuses = {url: "success" if status else "failed" for url, status in results.items()}
+    statuses = {}
+    successful = 0
+    for url, status in results.items():
+        statuses[url] = "success" if status else "failed"
+        successful += bool(status)
 
     metadata = {
         "links": statuses,
         "summary": {
             "total_websites": len(statuses),
-            "successful": sum(1 for s in statuses.values() if s == "success"),
+            "successful": successful,
             "elapsed_time": str(elapsed_time),
         },
     }
@@ -9,6 +9,8 @@ from zenml import step
 
 logger = logging.getLogger(__name__)
 
+DELETE_BATCH_SIZE = 5000
+
 client = MongoDatabaseConnector()
 database = client.get_database(settings.mongo.name)
 
@@ -16,6 +18,7 @@ database = client.get_database(settings.mongo.name)
 @step
 def remove_duplicate_links():
     """Remove duplicate links from the database."""
+    Link.ensure_indexes()
     collection = database[Link.get_collection_name()]
     duplicates = _find_duplicates(collection, group_by="url")
     return _remove_duplicates(collection, duplicates)
@@ -24,32 +27,38 @@ def remove_duplicate_links():
 @step
 def remove_duplicate_articles():
     """Remove duplicate articles from the database."""
+    Article.ensure_indexes()
     collection = database[Article.get_collection_name()]
     duplicates = _find_duplicates(collection, group_by="url")
     return _remove_duplicates(collection, duplicates)
 
 
 def _find_duplicates(collection, group_by: str):
-    """Find duplicate documents in collection."""
+    """Find the ids of duplicate documents to drop, keeping the first document of each group."""
+    # Decide which ids survive inside Mongo so only the ids to delete travel to the client
     pipeline = [
         {"$group": {"_id": f"${group_by}", "count": {"$sum": 1}, "ids": {"$push": "$_id"}}},
         {"$match": {"count": {"$gt": 1}}},
+        {"$project": {"_id": 0, "drop": {"$slice": ["$ids", 1, "$count"]}}},
+        {"$unwind": "$drop"},
     ]
-    return collection.aggregate(pipeline, allowDiskUse=True)
+    return collection.aggregate(pipeline, allowDiskUse=True, batchSize=DELETE_BATCH_SIZE)
 
 
 def _remove_duplicates(collection, duplicates_cursor) -> bool:
-    """Remove duplicate documents, keeping the first occurrence."""
+    """Remove duplicate documents in large id batches."""
     try:
         total_removed = 0
-        for duplicate_group in duplicates_cursor:
-            ids = duplicate_group["ids"]
-
-            # Keep first document, remove the rest
-            ids_to_remove = ids[1:]
-            if ids_to_remove:
-                result = collection.delete_many({"_id": {"$in": ids_to_remove}})
-                total_removed += result.deleted_count
+        ids_to_remove = []
+        for duplicate in duplicates_cursor:
+            ids_to_remove.append(duplicate["drop"])
+
+            if len(ids_to_remove) >= DELETE_BATCH_SIZE:
+                total_removed += collection.delete_many({"_id": {"$in": ids_to_remove}}).deleted_count
+                ids_to_remove = []
+
+        if ids_to_remove:
+            total_removed += collection.delete_many({"_id": {"$in": ids_to_remove}}).deleted_count
 
         logger.info("Removed %d duplicate documents", total_removed)
         return True
@@ -3,8 +3,10 @@
 import logging
 import time
 from datetime import timedelta
-from typing import Dict
+from typing import Dict, Iterator
 
+from news_summarizer.config import settings
+from news_summarizer.database.mongo import MongoDatabaseConnector
 from news_summarizer.domain.documents import Article, Link
 from news_summarizer.web import ScraperExecutor, scraper_registry
 from typing_extensions import Annotated
@@ -12,27 +14,41 @@ from zenml import get_step_context, step
 
 logger = logging.getLogger(__name__)
 
+UNSCRAPED_LINKS_BATCH_SIZE = 500
+PROGRESS_LOG_INTERVAL = 100
+
+client = MongoDatabaseConnector()
+database = client.get_database(settings.mongo.name)
+
 
 @step
-def scrape_articles() -> Annotated[Dict[str, str], "scraped_articles"]:
+def scrape_articles(max_concurrent_scrapers: int = 4) -> Annotated[Dict[str, str], "scraped_articles"]:
     """Scrape full content from article links."""
-    articles_to_scrape = _get_unscraped_links()
-    logger.info("Starting to scrape %d articles", len(articles_to_scrape))
+    articles_to_scrape = _iter_unscraped_links()
+    logger.info("Starting to scrape articles with %d concurrent scrapers", max_concurrent_scrapers)
 
     start_time = time.time()
-    executor = ScraperExecutor(scraper_registry)
-    results = executor.run(articles_to_scrape)
-    elapsed_time = timedelta(seconds=time.time() - start_time)
+    executor = ScraperExecutor(
+        scraper_registry, max_concurrent_scrapers=max_concurrent_scrapers, max_workers=max_concurrent_scrapers
+    )
 
-    logger.info("Article scraping completed in %s", elapsed_time)
+    # Tally results as scrapers finish instead of collecting them all first
+    statuses = {}
+    successful = 0
+    for url, status in executor.run_iter(articles_to_scrape):
+        statuses[url] = "success" if status else "failed"
+        successful += bool(status)
+        if len(statuses) % PROGRESS_LOG_INTERVAL == 0:
+            logger.info("Scraped %d articles so far, %d successful", len(statuses), successful)
 
-    statuses = {url: "success" if status else "failed" for url, status in results.items()}
+    elapsed_time = timedelta(seconds=time.time() - start_time)
+    logger.info("Article scraping completed in %s", elapsed_time)
 
     metadata = {
         "articles": statuses,
         "summary": {
             "total_articles": len(statuses),
-            "successful": sum(1 for s in statuses.values() if s == "success"),
+            "successful": successful,
             "elapsed_time": str(elapsed_time),
         },
     }
@@ -43,10 +59,31 @@ def scrape_articles() -> Annotated[Dict[str, str], "scraped_articles"]:
     return metadata
 
 
-def _get_unscraped_links(max_articles: int = 2000) -> list[str]:
-    """Get links that haven't been scraped yet."""
-    link_urls = {str(link.url) for link in Link.bulk_find(**{})}
-    article_urls = {str(article.url) for article in Article.bulk_find(**{})}
+def _iter_unscraped_links(max_articles: int = 2000) -> Iterator[str]:
+    """Iterate over links that haven't been scraped yet."""
+    # The lookup probes article.url once per link, so make sure it is indexed
+    Article.ensure_indexes()
 
-    unscraped = list(link_urls - article_urls)[:max_articles]
-    return unscraped
+    # Anti-join inside Mongo instead of loading both collections to diff them client-side
+    pipeline = [
+        {
+            "$lookup": {
+                "from": Article.get_collection_name(),
+                "localField": "url",
+                "foreignField": "url",
+                # Only existence matters, so don't pull matching articles' content into the join
+                "pipeline": [{"$limit": 1}, {"$project": {"_id": 1}}],
+                "as": "scraped",
+            }
+        },
+        {"$match": {"scraped": {"$eq": []}}},
+        {"$group": {"_id": "$url"}},
+        {"$limit": max_articles},
+    ]
+    cursor = database[Link.get_collection_name()].aggregate(
+        pipeline, allowDiskUse=True, batchSize=UNSCRAPED_LINKS_BATCH_SIZE
+    )
+    # Drain the cursor up front: scrapers consume links slowly enough for an open cursor to time out
+    # mid-run, while the result is only up to max_articles URL strings
+    links = [document["_id"] for document in cursor]
+    return iter(links)
@@ -1,8 +1,14 @@
 """Steps for document processing and vectorization."""
 
 from .document_loader import load_articles
-from .document_store import store_documents
+from .document_store import store_documents, store_processed_documents
 from .text_cleaner import clean_articles
 from .vectorizer import vectorize_articles
 
-__all__ = ["load_articles", "clean_articles", "vectorize_articles", "store_documents"]
+__all__ = [
+    "load_articles",
+    "clean_articles",
+    "vectorize_articles",
+    "store_documents",
+    "store_processed_documents",
+]
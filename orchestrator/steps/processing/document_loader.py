@@ -1,25 +1,73 @@
 """Step for loading raw articles from database."""
 
 import logging
-from typing import List
+from itertools import islice
+from typing import Dict, Iterator, List
+from uuid import UUID
 
+from news_summarizer.config import settings
+from news_summarizer.database.mongo import MongoDatabaseConnector
 from news_summarizer.domain.documents import Article
+from news_summarizer.domain.embedded_chunks import EmbeddedArticleChunk
 from typing_extensions import Annotated
 from zenml import get_step_context, step
 
 logger = logging.getLogger(__name__)
 
+LOAD_PAGE_SIZE = 1000
+
+client = MongoDatabaseConnector()
+database = client.get_database(settings.mongo.name)
+
 
 @step
-def load_articles() -> Annotated[List[Article], "raw_articles"]:
-    """Load all raw articles from database."""
-    articles = Article.bulk_find(**{})
+def load_articles(skip_processed: bool = True) -> Annotated[List[Article], "raw_articles"]:
+    """Load raw articles from database, leaving out those whose chunks are already stored."""
+    stats = {"total": 0, "skipped_processed": 0, "invalid": 0}
+    articles = list(_iter_articles(stats, skip_processed))
 
-    metadata = {"loaded_articles": {"count": len(articles)}}
+    metadata = {"loaded_articles": {"count": len(articles), **stats}}
 
     context = get_step_context()
     context.add_output_metadata(output_name="raw_articles", metadata=metadata)
 
-    logger.info("Loaded %d raw articles", len(articles))
+    logger.info("Loaded %d raw articles, skipped %d already processed", len(articles), stats["skipped_processed"])
 
     return articles
+
+
+def _iter_articles(stats: Dict[str, int], skip_processed: bool = True) -> Iterator[Article]:
+    """Stream articles page by page, only building models for those not processed yet."""
+    if skip_processed:
+        # Each page looks its ids up by document_id across every stored chunk
+        EmbeddedArticleChunk.ensure_payload_indexes()
+
+    cursor = database[Article.get_collection_name()].find({})
+
+    # Cursor and lookup errors are left to fail the step rather than return a partial list
+    while page := list(islice(cursor, LOAD_PAGE_SIZE)):
+        stats["total"] += len(page)
+
+        documents = {}
+        for document in page:
+            try:
+                documents[str(UUID(str(document["_id"])))] = document
+            except (KeyError, ValueError) as exc:
+                logger.error("Skipping article with invalid id %s: %s", document.get("_id"), exc)
+                stats["invalid"] += 1
+
+        processed_ids = set()
+        if skip_processed:
+            # Embedded chunks are the pipeline's last write and cleaned articles are stored even when
+            # their chunks fail, so only an article with stored chunks counts as processed
+            processed_ids = EmbeddedArticleChunk.find_existing_payload_values("document_id", documents)
+            stats["skipped_processed"] += len(processed_ids)
+
+        for document_id, document in documents.items():
+            if document_id in processed_ids:
+                continue
+            try:
+                yield Article.from_mongo(document)
+            except ValueError as exc:
+                logger.error("Skipping invalid article %s: %s", document_id, exc)
+                stats["invalid"] += 1
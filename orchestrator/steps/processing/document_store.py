@@ -1,7 +1,9 @@
 """Step for storing processed documents."""
 
 import logging
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Union
 
 from news_summarizer.domain.clean_documents import CleanedArticle
 from news_summarizer.domain.embedded_chunks import EmbeddedArticleChunk
@@ -11,7 +13,12 @@ from zenml import get_step_context, step
 
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = 5000
+# Embedded chunks carry a dense vector per point, so keep their upserts smaller
+BATCH_SIZES = {
+    CleanedArticle: 1000,
+    EmbeddedArticleChunk: 500,
+}
+MAX_WRITERS = 4
 
 
 @step
@@ -20,34 +27,89 @@ def store_documents(
 ) -> Annotated[bool, "storage_success"]:
     """Store processed documents in database."""
     try:
-        total_stored = 0
-        for i, document_batch in enumerate(batch(documents, BATCH_SIZE)):
-            _bulk_store_documents(document_batch)
-            logger.info("Storing %d with %d documents", i, BATCH_SIZE)
-            total_stored += len(document_batch)
-
-        metadata = {"stored_documents": total_stored}
-        context = get_step_context()
-        context.add_output_metadata(output_name="storage_success", metadata=metadata)
-
-        logger.info("Successfully stored %d documents", total_stored)
-        return True
-
+        results = _store_documents(documents)
     except Exception as exc:
         logger.error("Failed to store documents: %s", exc)
         return False
 
+    context = get_step_context()
+    context.add_output_metadata(output_name="storage_success", metadata=results)
+
+    return results["failed_documents"] == 0
+
+
+@step
+def store_processed_documents(
+    cleaned_articles: Annotated[List[CleanedArticle], "cleaned_articles"],
+    embedded_chunks: Annotated[List[EmbeddedArticleChunk], "embedded_chunks"],
+) -> Annotated[bool, "storage_success"]:
+    """Store cleaned articles and embedded chunks concurrently."""
+    collections = {"cleaned_articles": cleaned_articles, "embedded_chunks": embedded_chunks}
+    metadata = {}
+
+    # The two writes are independent I/O, so the step takes as long as the slower one
+    with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+        futures = {name: executor.submit(_store_documents, documents) for name, documents in collections.items()}
+
+        for name, future in futures.items():
+            try:
+                metadata[name] = future.result()
+            except Exception as exc:
+                logger.error("Failed to store %s: %s", name, exc)
+                metadata[name] = {"stored_documents": 0, "failed_documents": len(collections[name])}
+
+    context = get_step_context()
+    context.add_output_metadata(output_name="storage_success", metadata=metadata)
 
-def _bulk_store_documents(documents: List[Union[CleanedArticle, EmbeddedArticleChunk]]):
-    """Store a batch of documents based on their type."""
+    return all(results["failed_documents"] == 0 for results in metadata.values())
+
+
+def _store_documents(documents: List[Union[CleanedArticle, EmbeddedArticleChunk]]) -> Dict[str, int]:
+    """Store documents in concurrent batches and return the stored/failed counts."""
     if not documents:
-        return
+        logger.info("No documents to store")
+        return {"stored_documents": 0, "failed_documents": 0}
+
+    document_type = _get_document_type(documents)
+    # Create the collection up front so concurrent writers do not race to create it
+    document_type.get_or_create_collection()
+
+    batches = list(batch(documents, BATCH_SIZES[document_type]))
+    *queued_batches, last_batch = batches
+    total_stored = 0
+    total_failed = 0
+
+    # Don't wait for Qdrant to apply each batch, only for it to accept the write,
+    # and overlap serialization of the next batches with the upserts already in flight
+    results = []
+    if queued_batches:
+        with ThreadPoolExecutor(max_workers=min(MAX_WRITERS, len(queued_batches))) as executor:
+            results.extend(executor.map(partial(document_type.bulk_insert, wait=False), queued_batches))
+
+    # Qdrant applies a collection's updates in order, so waiting on the last batch
+    # means every batch is searchable by the time the step returns
+    results.append(document_type.bulk_insert(last_batch, wait=True))
 
+    for i, (document_batch, stored) in enumerate(zip(batches, results, strict=True)):
+        if stored:
+            logger.info("Stored batch %d with %d documents", i, len(document_batch))
+            total_stored += len(document_batch)
+        else:
+            logger.error("Failed to store batch %d with %d documents", i, len(document_batch))
+            total_failed += len(document_batch)
+
+    if document_type.get_use_vector_index():
+        document_type.ensure_vector_index()
+
+    logger.info("Stored %d %s documents, %d failed", total_stored, document_type.__name__, total_failed)
+    return {"stored_documents": total_stored, "failed_documents": total_failed}
+
+
+def _get_document_type(documents: List[Union[CleanedArticle, EmbeddedArticleChunk]]):
+    """Resolve the document class of a homogeneous list of documents."""
     document_type = type(documents[0])
 
-    if document_type == CleanedArticle:
-        CleanedArticle.bulk_insert(documents)
-    elif document_type == EmbeddedArticleChunk:
-        EmbeddedArticleChunk.bulk_insert(documents)
-    else:
+    if document_type not in BATCH_SIZES:
         raise ValueError(f"Unsupported document type: {document_type}")
+
+    return document_type
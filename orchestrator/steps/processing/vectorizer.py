@@ -1,6 +1,7 @@
 """Step for vectorizing article chunks."""
 
 import logging
+from functools import lru_cache
 from typing import List
 
 from news_summarizer.domain.clean_documents import CleanedArticle
@@ -28,6 +29,14 @@ PORTUGUESE_TEXT_SEPARATORS = [
     "\u00a0",  # Non-breaking space
 ]
 
+EMBED_BATCH_SIZE = 256
+
+
+@lru_cache(maxsize=1)
+def _get_chunking_service() -> ChunkingService:
+    """Build the chunking service once per process and reuse its splitters across runs."""
+    return ChunkingService(separators=PORTUGUESE_TEXT_SEPARATORS)
+
 
 @step
 def vectorize_articles(
@@ -36,39 +45,40 @@ def vectorize_articles(
     """Chunk and vectorize cleaned articles."""
     # Initialize services
     embedder = EmbeddingModel(device=device_selector(), cache_dir=None)
-    chunking_service = ChunkingService(separators=PORTUGUESE_TEXT_SEPARATORS)
+    chunking_service = _get_chunking_service()
     embedder_service = EmbedderService(embedder)
 
     # Tracking metrics
     chunking_stats = {"success": 0, "failed": 0}
     embedding_stats = {"success": 0, "failed": 0}
 
-    embedded_chunks = []
-
+    # First pass: chunk every article so the total number of chunks is known up front
+    chunks = []
     for article in cleaned_articles:
-        # Chunk the article
         try:
-            chunks = chunking_service.chunk(article)
+            chunks.extend(chunking_service.chunk(article))
             chunking_stats["success"] += 1
         except Exception as exc:
             logger.error("Failed to chunk article %s: %s", article.id, exc)
             chunking_stats["failed"] += 1
-            continue
 
-        # Embed chunks in batches
+    # Second pass: embed full batches across articles into a preallocated output list
+    embedded_chunks = [None] * len(chunks)
+    filled = 0
+    for chunk_batch in batch(chunks, EMBED_BATCH_SIZE):
         try:
-            for chunk_batch in batch(chunks, 50):
-                try:
-                    embedded_batch = embedder_service.embed(chunk_batch)
-                    embedded_chunks.extend(embedded_batch)
-                    embedding_stats["success"] += len(embedded_batch)
-                except Exception as exc:
-                    logger.error("Failed to embed chunk batch: %s", exc)
-                    embedding_stats["failed"] += len(chunk_batch)
-
+            embedded_batch = embedder_service.embed(chunk_batch)
+            embedded_chunks[filled : filled + len(embedded_batch)] = embedded_batch
+            filled += len(embedded_batch)
+            # The embedder swallows model errors and returns fewer (or no) vectors instead of raising
+            embedding_stats["success"] += len(embedded_batch)
+            embedding_stats["failed"] += len(chunk_batch) - len(embedded_batch)
         except Exception as exc:
-            logger.error("Failed to process chunks for article %s: %s", article.id, exc)
-            embedding_stats["failed"] += len(chunks)
+            logger.error("Failed to embed chunk batch: %s", exc)
+            embedding_stats["failed"] += len(chunk_batch)
+
+    # Drop the slots left unused by failed batches
+    del embedded_chunks[filled:]
 
     # Prepare metadata
     metadata = {
@@ -97,3 +107,5 @@ def vectorize_articles(
     logger.info(
         "Vectorization complete: %d chunks embedded, %d failed", embedding_stats["success"], embedding_stats["failed"]
     )
+
+    return embedded_chunks
@@ -1,3 +1,6 @@
+from functools import cached_property, lru_cache
+from typing import Literal
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,7 +24,7 @@ class MongoSettings(BaseSettings):
     host: str = Field("localhost", json_schema_extra={"env": "HOST"})
     port: int = Field(27017, json_schema_extra={"env": "PORT"})
 
-    @property
+    @cached_property
     def dsn(self) -> str:
         return f"mongodb://{self.username}:{self.password.get_secret_value()}@{self.host}:{self.port}"
 
@@ -40,6 +43,7 @@ class QdrantSettings(BaseSettings):
     host: str = Field("localhost", json_schema_extra={"env": "DATABASE_HOST"})
     rest_port: int = Field(6333, json_schema_extra={"env": "REST_API_PORT"})
     grpc_port: int = Field(6334, json_schema_extra={"env": "GRPC_API_PORT"})
+    prefer_grpc: bool = Field(True, json_schema_extra={"env": "PREFER_GRPC"})
     cloud_url: str = Field("", json_schema_extra={"env": "CLOUD_URL"})
     apikey: SecretStr | None = Field(None, json_schema_extra={"env": "APIKEY"})
 
@@ -49,12 +53,21 @@ class RAGSettings(BaseSettings):
     embedding_model_id: str = Field(None, json_schema_extra={"env": "EMBEDDING_MODEL_ID"})
     reranking_cross_encoder_model_id: str = Field(None, json_schema_extra={"env": "RERANKING_CROSS_ENCODER_MODEL_ID"})
     model_device: str = Field("cpu", json_schema_extra={"env": "MODEL_DEVICE"})
+    model_precision: Literal["float32", "float16", "bfloat16", "int8"] = Field(
+        "float32", json_schema_extra={"env": "MODEL_PRECISION"}
+    )
+    compile_model: bool = Field(False, json_schema_extra={"env": "COMPILE_MODEL"})
+    use_autocast: bool = Field(False, json_schema_extra={"env": "USE_AUTOCAST"})
 
 
 class DatasetGeneratorSettings(BaseSettings):
     model_config = SettingsConfigDict(env=".env", env_prefix="DATASET_", protected_namespaces=("settings_",))
     generator_model_id: str = Field(None, json_schema_extra={"env": "GENERATOR_MODEL_ID"})
     generator_device: str = Field("cpu", json_schema_extra={"env": "GENERATOR_DEVICE"})
+    generator_quantization: Literal["none", "int8", "nf4"] = Field(
+        "none", json_schema_extra={"env": "GENERATOR_QUANTIZATION"}
+    )
+    compile_model: bool = Field(False, json_schema_extra={"env": "COMPILE_MODEL"})
 
 
 class Settings:
@@ -68,9 +81,10 @@ class Settings:
         self.dataset = DatasetGeneratorSettings()
 
     @classmethod
+    @lru_cache(maxsize=1)
     def load_settings(cls) -> "Settings":
         """
-        Load settings from environment variables or defaults.
+        Load settings from environment variables or defaults, once per process.
         """
         return cls()
 
@@ -1,7 +1,9 @@
 import logging
 import re
+from functools import lru_cache
 
 from news_summarizer.config import settings
+from news_summarizer.utils import is_hashable
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
 
@@ -12,6 +14,13 @@ logger = logging.getLogger(__name__)
 class FakeMongoCollection:
     def __init__(self):
         self.data = {}
+        self.indexes = set()
+        # field -> value -> ids in insertion order, so equality queries don't scan every document
+        self._field_index = {}
+
+    def create_index(self, keys, **kwargs):
+        self.indexes.add(keys if isinstance(keys, str) else tuple(keys))
+        return keys if isinstance(keys, str) else "_".join(f"{key}_{direction}" for key, direction in keys)
 
     def insert_one(self, document):
         if "_id" not in document:
@@ -19,21 +28,30 @@ class FakeMongoCollection:
         if document["_id"] in self.data:
             raise ValueError("Duplicate _id found")
         self.data[document["_id"]] = document
+        self._index_document(document)
         logger.debug("Inserted document: %s", document)
 
-    def insert_many(self, documents):
+    def insert_many(self, documents, ordered=True):
         if not documents:
             raise ValueError("Documents list cannot be empty")
+        duplicates = 0
         for document in documents:
             if "_id" not in document:
                 raise ValueError("Each document must contain an '_id' field")
             if document["_id"] in self.data:
-                raise ValueError("Duplicate _id found")
+                # Like Mongo, an unordered insert keeps going and reports the failures at the end
+                if ordered:
+                    raise ValueError("Duplicate _id found")
+                duplicates += 1
+                continue
             self.data[document["_id"]] = document
+            self._index_document(document)
         logger.debug("Inserted documents: %s", documents)
+        if duplicates:
+            raise ValueError(f"Duplicate _id found in {duplicates} documents")
 
     def find_one(self, query):
-        for document in self.data.values():
+        for document in self._candidates(query):
             if all(self._match_query(document, key, value) for key, value in query.items()):
                 logger.debug("Found document: %s", document)
                 return document
@@ -43,18 +61,41 @@ class FakeMongoCollection:
     def find(self, query):
         results = [
             document
-            for document in self.data.values()
+            for document in self._candidates(query)
             if all(self._match_query(document, key, value) for key, value in query.items())
         ]
         logger.debug("Found documents:", results)
         return results
 
+    def _index_document(self, document):
+        for key, value in document.items():
+            if is_hashable(value):
+                self._field_index.setdefault(key, {}).setdefault(value, {})[document["_id"]] = None
+
+    def _candidates(self, query):
+        # Narrow down to the smallest bucket among the equality predicates; operators such as
+        # $regex, None (which also matches missing fields) and unhashable values need the full scan
+        buckets = [
+            self._field_index.get(key, {}).get(value, {})
+            for key, value in query.items()
+            if value is not None and not isinstance(value, dict) and is_hashable(value)
+        ]
+        if not buckets:
+            return self.data.values()
+        return (self.data[_id] for _id in min(buckets, key=len) if _id in self.data)
+
     def _match_query(self, document, key, value):
         if isinstance(value, dict) and "$regex" in value:
-            return re.search(value["$regex"], document.get(key, "")) is not None
+            return _compile_regex(value["$regex"]).search(document.get(key, "")) is not None
         return document.get(key) == value
 
 
+@lru_cache(maxsize=128)
+def _compile_regex(pattern: str) -> re.Pattern:
+    # A query matches the same pattern against every document, so compile it once per pattern
+    return re.compile(pattern)
+
+
 class FakeDatabase:
     def __init__(self):
         self.collections = {}
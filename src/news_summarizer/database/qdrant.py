@@ -1,88 +1,260 @@
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 from news_summarizer.config import settings
+from news_summarizer.utils import is_hashable
 from qdrant_client import QdrantClient
 from qdrant_client.http.exceptions import UnexpectedResponse
-from qdrant_client.models import PointStruct, Record
+from qdrant_client.models import Filter, HnswConfig, HnswConfigDiff, PointStruct, Record, ScoredPoint
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-def calculate_similarity(vector1, vector2):
-    return np.dot(vector1, vector2) / (np.linalg.norm(vector1) * np.linalg.norm(vector2))
+SEARCH_MATRIX_CAPACITY = 1024
+SEARCH_CACHE_SIZE = 1024
 
 
 class FakeQdrantCollection:
     def __init__(self):
         self.vectors = {}
+        # Searches run against one matrix of L2-normalized vectors. Upserts write rows in place into a
+        # buffer that doubles when full, so bulk ingest doesn't rebuild the matrix on every call
+        self._search_ids = []
+        self._search_rows = {}
+        self._search_matrix = None
+        self._stale = False
+        # Results of recent searches, keyed on the query bytes, limit and filter; any upsert clears it
+        self._search_cache = OrderedDict()
+        # payload key -> value -> point ids, so filters narrow down candidates without a full scan
+        self._payload_index = {}
+        # Point ids in insertion order and their positions, so a scroll offset is a single lookup
+        self._ordered_ids = []
+        self._positions = {}
+        # Every payload key is indexed above; this only records the indexes callers asked for
+        self.payload_schema = {}
+        # Qdrant's default index parameters, until the collection is created or updated with others
+        self.config = SimpleNamespace(hnsw_config=HnswConfig(m=16, ef_construct=100, full_scan_threshold=10000))
+
+    def update_hnsw_config(self, hnsw_config: Optional[HnswConfigDiff]):
+        if hnsw_config is not None:
+            update = hnsw_config.model_dump(exclude_none=True)
+            self.config.hnsw_config = self.config.hnsw_config.model_copy(update=update)
 
     def upsert(self, points: List[PointStruct]):
         for point in points:
             if not isinstance(point, PointStruct):
                 raise ValueError("Each point must be an instance of PointStruct.")
-            self.vectors[point.id] = point.model_dump()
+            if point.id in self.vectors:
+                self._unindex_payload(point.id, self.vectors[point.id]["payload"])
+            else:
+                self._positions[point.id] = len(self._ordered_ids)
+                self._ordered_ids.append(point.id)
+            # PointStruct already validated the fields, so store them as-is instead of re-serializing
+            self.vectors[point.id] = {"id": point.id, "vector": point.vector, "payload": point.payload}
+            self._index_payload(point.id, point.payload)
+            self._write_row(point.id, point.vector)
+        self._search_cache.clear()
         logger.debug("Upserted points: %s", points)
 
-    def search(self, query_vector: List[float], limit: int, filter: Optional[Dict[str, Any]] = None):
+    def search(
+        self,
+        query_vector: List[float],
+        limit: int,
+        filter: Optional[Dict[str, Any]] = None,
+        with_payload: bool = True,
+        with_vectors: bool = True,
+    ) -> List[ScoredPoint]:
         if not isinstance(query_vector, list) or not query_vector:
             raise ValueError("Query vector must be a non-empty list.")
         if not isinstance(limit, int) or limit <= 0:
             raise ValueError("Limit must be a positive integer.")
 
-        results = [
-            {
-                "id": key,
-                "vector": value["vector"],
-                "payload": value.get("payload"),
-                "similarity": calculate_similarity(query_vector, value["vector"]),
-            }
-            for key, value in self.vectors.items()
-            if not filter or self._match_filter(value, filter)
+        query = np.asarray(query_vector, dtype=np.float32)
+        cache_key = None
+        if filter is None or all(is_hashable(value) for value in filter.values()):
+            filter_key = tuple(sorted(filter.items())) if filter else None
+            cache_key = (query.tobytes(), limit, filter_key, with_payload, with_vectors)
+            if cache_key in self._search_cache:
+                self._search_cache.move_to_end(cache_key)
+                return _copy_points(self._search_cache[cache_key])
+
+        results = self._search(query, limit, filter, with_payload, with_vectors)
+        if cache_key is not None:
+            self._search_cache[cache_key] = results
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+            # Callers get their own points, so changing a result never changes what the cache returns next
+            return _copy_points(results)
+        return results
+
+    def _search(
+        self, query: np.ndarray, limit: int, filter: Optional[Dict[str, Any]], with_payload: bool, with_vectors: bool
+    ) -> List[ScoredPoint]:
+        ids, matrix = self._get_search_matrix()
+        if filter:
+            # Only score the rows of points that pass the filter
+            rows = [self._search_rows[key] for key in self._filtered_ids(filter) if key in self._search_rows]
+            ids, matrix = [ids[row] for row in rows], matrix[rows]
+        if not ids:
+            return []
+
+        # With unit rows, cosine similarity against every point is a single matrix-vector product
+        similarities = matrix @ (query / (np.linalg.norm(query) or 1.0))
+
+        # Only the top `limit` candidates need ordering, so partition before sorting
+        candidates = np.arange(len(ids))
+        if limit < len(candidates):
+            candidates = np.argpartition(-similarities, limit - 1)[:limit]
+        candidates = candidates[np.argsort(-similarities[candidates], kind="stable")]
+
+        # Same shape as the real client's results; the fields are already valid, so skip validation
+        points = [self.vectors[ids[index]] for index in candidates]
+        return [
+            ScoredPoint.model_construct(
+                id=str(point["id"]),
+                version=0,
+                score=float(similarities[index]),
+                payload=point["payload"] if with_payload else None,
+                vector=point["vector"] if with_vectors else None,
+            )
+            for index, point in zip(candidates, points, strict=True)
         ]
 
-        results = sorted(results, key=lambda x: x["similarity"], reverse=True)
-        return results[:limit]
-
-    def scroll(self, limit: int, offset: int = 0, filter: Optional[Dict[str, Any]] = None):
-        points = list(self.vectors.values())
+    def _write_row(self, point_id, vector):
+        if self._stale:
+            return
+        row = self._search_rows.get(point_id)
+        matrix = self._search_matrix
+        # Anything the buffer can't hold in place (a non-dense vector, a new dimension) falls back to a rebuild
+        if not isinstance(vector, list) or (matrix is not None and len(vector) != matrix.shape[1]):
+            self._stale = True
+            return
+        if row is None:
+            row = len(self._search_ids)
+            if matrix is None or row == len(matrix):
+                self._grow(len(vector))
+            self._search_rows[point_id] = row
+            self._search_ids.append(point_id)
+        self._search_matrix[row] = _normalize(np.asarray(vector, dtype=np.float32))
+
+    def _grow(self, dim: int):
+        capacity = 2 * len(self._search_matrix) if self._search_matrix is not None else SEARCH_MATRIX_CAPACITY
+        matrix = np.empty((capacity, dim), dtype=np.float32)
+        if self._search_matrix is not None:
+            matrix[: len(self._search_ids)] = self._search_matrix[: len(self._search_ids)]
+        self._search_matrix = matrix
+
+    def _get_search_matrix(self):
+        if self._stale:
+            self._search_ids = [key for key, value in self.vectors.items() if isinstance(value["vector"], list)]
+            self._search_rows = {key: row for row, key in enumerate(self._search_ids)}
+            matrix = np.asarray([self.vectors[key]["vector"] for key in self._search_ids], dtype=np.float32)
+            self._search_matrix = _normalize(matrix) if self._search_ids else None
+            self._stale = False
+        if self._search_matrix is None:
+            return [], np.empty((0, 0), dtype=np.float32)
+        # Rows past the live ones are unused capacity
+        return self._search_ids, self._search_matrix[: len(self._search_ids)]
 
+    def scroll(
+        self,
+        limit: int,
+        offset: int = 0,
+        filter: Optional[Dict[str, Any]] = None,
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: bool = True,
+        scroll_filter: Optional[Filter] = None,
+    ):
         # Apply filter if provided
-        if filter:
-            points = [point for point in points if self._match_filter(point, filter)]
-
-        if offset is not None:
-            offset_index = next((i for i, point in enumerate(points) if point["id"] == str(offset)), 0)
+        if filter or scroll_filter:
+            ids = self._filtered_ids(filter) if filter else list(self._ordered_ids)
+            if scroll_filter:
+                ids = self._scroll_filtered_ids(ids, scroll_filter)
+            positions = {key: index for index, key in enumerate(ids)}
         else:
-            offset_index = 0
+            ids, positions = self._ordered_ids, self._positions
 
-        chunk = points[offset_index : offset_index + limit]
+        offset_index = positions.get(str(offset), 0) if offset is not None else 0
 
-        chunk = [
-            Record(
-                id=str(point.get("id", "")),
-                vector=point.get("vector"),
-                payload=point.get("payload"),
-            )
-            for point in chunk
-        ]
+        chunk = self._records(ids[offset_index : offset_index + limit], with_payload, with_vectors)
 
-        next_offset = offset_index + limit if offset_index + limit < len(points) else None
-        if next_offset is not None and next_offset < len(points):
-            next_offset = str(points[next_offset]["id"])
+        next_offset = offset_index + limit if offset_index + limit < len(ids) else None
+        if next_offset is not None and next_offset < len(ids):
+            next_offset = str(self.vectors[ids[next_offset]]["id"])
 
         logger.debug("Scroll results: %s, next offset: %s", chunk, next_offset)
         return chunk, next_offset
 
+    def _records(self, ids: List, with_payload: Union[bool, List[str]], with_vectors: bool) -> List[Record]:
+        # Stored points always carry id, vector and payload; leave out what the caller didn't ask for
+        points = [self.vectors[_id] for _id in ids]
+        return [
+            Record(
+                id=str(point["id"]),
+                vector=point["vector"] if with_vectors else None,
+                payload=_select_payload(point["payload"], with_payload),
+            )
+            for point in points
+        ]
+
+    def _index_payload(self, point_id, payload: Optional[Dict[str, Any]]):
+        for key, value in (payload or {}).items():
+            if is_hashable(value):
+                self._payload_index.setdefault(key, {}).setdefault(value, {})[point_id] = None
+
+    def _unindex_payload(self, point_id, payload: Optional[Dict[str, Any]]):
+        for key, value in (payload or {}).items():
+            if is_hashable(value):
+                self._payload_index.get(key, {}).get(value, {}).pop(point_id, None)
+
+    def _filtered_ids(self, filter: Dict[str, Any]) -> List:
+        # None also matches points missing the key, and unhashable values aren't indexed, so scan for those
+        if any(value is None or not is_hashable(value) for value in filter.values()):
+            return [key for key, point in self.vectors.items() if self._match_filter(point, filter)]
+        # Otherwise start from the smallest bucket and check the remaining conditions on its points only
+        smallest = min((self._payload_index.get(key, {}).get(value, {}) for key, value in filter.items()), key=len)
+        return [key for key in smallest if self._match_filter(self.vectors[key], filter)]
+
+    def _scroll_filtered_ids(self, ids: List, scroll_filter: Filter) -> List:
+        # Only `must` conditions matching a value or any of a list of values are supported
+        for condition in scroll_filter.must or []:
+            values = getattr(condition.match, "any", None)
+            if values is None:
+                values = [condition.match.value]
+            bucket = self._payload_index.get(condition.key, {})
+            matching = {key for value in values for key in bucket.get(value, {})}
+            ids = [key for key in ids if key in matching]
+        return ids
+
     def _match_filter(self, point: Dict[str, Any], filter: Dict[str, Any]):
         for key, value in filter.items():
-            if point.get("payload", {}).get(key) != value:
+            if (point["payload"] or {}).get(key) != value:
                 return False
         return True
 
 
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    # Zero vectors stay zero instead of turning into NaNs
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def _copy_points(points: List[ScoredPoint]) -> List[ScoredPoint]:
+    return [point.model_copy() for point in points]
+
+
+def _select_payload(payload: Optional[Dict[str, Any]], with_payload: Union[bool, List[str]]):
+    if with_payload is True or payload is None:
+        return payload
+    if not with_payload:
+        return None
+    return {key: payload[key] for key in with_payload if key in payload}
+
+
 class FakeQdrantClient:
     def __init__(self):
         self.collections = {}
@@ -92,72 +264,117 @@ class FakeQdrantClient:
             self.collections[collection_name] = FakeQdrantCollection()
         return self.collections[collection_name]
 
-    def create_collection(self, collection_name: str, vectors_config: Optional[Dict[str, Any]] = None):
+    def create_collection(
+        self,
+        collection_name: str,
+        vectors_config: Optional[Dict[str, Any]] = None,
+        hnsw_config: Optional[Any] = None,
+        quantization_config: Optional[Any] = None,
+    ):
         if collection_name not in self.collections:
             self.collections[collection_name] = FakeQdrantCollection()
+            self.collections[collection_name].update_hnsw_config(hnsw_config)
             logger.debug("Created collection: %s", collection_name)
         return self.collections[collection_name]
 
-    def upsert(self, collection_name: str, points: List[PointStruct]):
+    def collection_exists(self, collection_name: str) -> bool:
+        return collection_name in self.collections
+
+    def create_payload_index(self, collection_name: str, field_name: str, field_schema: Optional[Any] = None):
+        self.get_collection(collection_name).payload_schema[field_name] = field_schema
+        return True
+
+    def update_collection(self, collection_name: str, hnsw_config: Optional[HnswConfigDiff] = None, **kwargs) -> bool:
+        self.get_collection(collection_name).update_hnsw_config(hnsw_config)
+        return True
+
+    def upsert(self, collection_name: str, points: List[PointStruct], wait: bool = True):
         collection = self.get_collection(collection_name)
         return collection.upsert(points)
 
-    def scroll(
+    def search(
         self,
         collection_name: str,
+        query_vector: List[float],
         limit: int,
         with_payload: bool = True,
         with_vectors: bool = False,
-        offset: int = 0,
         filter: Optional[Dict[str, Any]] = None,
     ):
         collection = self.get_collection(collection_name)
+        return collection.search(
+            query_vector, limit, filter=filter, with_payload=with_payload, with_vectors=with_vectors
+        )
 
-        chunk, next_offset = collection.scroll(limit=limit, offset=offset, filter=filter)
-
-        # Modify the results based on `with_payload` and `with_vectors` flags
-        # for result in chunk:
-        #    if not with_payload:
-        #        result.pop("payload", True)
-        #    if not with_vectors:
-        #        result.pop("vector", False)
+    def scroll(
+        self,
+        collection_name: str,
+        limit: int,
+        with_payload: Union[bool, List[str]] = True,
+        with_vectors: bool = False,
+        offset: int = 0,
+        filter: Optional[Dict[str, Any]] = None,
+        scroll_filter: Optional[Filter] = None,
+    ):
+        collection = self.get_collection(collection_name)
 
-        return chunk, next_offset
+        return collection.scroll(
+            limit=limit,
+            offset=offset,
+            filter=filter,
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+            scroll_filter=scroll_filter,
+        )
 
 
 class QdrantDatabaseConnector:
     _instance: QdrantClient | None = None
+    _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs) -> QdrantClient:
         if cls._instance is None:
-            try:
-                if settings.qdrant.use_cloud:
-                    cls._instance = QdrantClient(
-                        url=settings.qdrant.cloud_url,
-                        api_key=settings.qdrant.apikey,
-                    )
-
-                    uri = settings.qdrant.cloud_url
-                else:
-                    cls._instance = QdrantClient(
-                        host=settings.qdrant.host,
-                        port=settings.qdrant.rest_port,
-                    )
-
-                    uri = f"{settings.qdrant.host}:{settings.qdrant.rest_port}"
-
-                logger.info("Connection to Qdrant DB with URI successful: %s", uri)
-            except UnexpectedResponse:
-                logger.exception(
-                    "Couldn't connect to Qdrant.",
+            # Check again under the lock so threads racing on the first call share a single client
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls._connect()
+
+        return cls._instance
+
+    @staticmethod
+    def _connect() -> QdrantClient:
+        try:
+            # gRPC multiplexes requests over one HTTP/2 channel and skips JSON encoding of vectors
+            if settings.qdrant.use_cloud:
+                client = QdrantClient(
+                    url=settings.qdrant.cloud_url,
+                    api_key=settings.qdrant.apikey,
+                    prefer_grpc=settings.qdrant.prefer_grpc,
+                )
+
+                uri = settings.qdrant.cloud_url
+            else:
+                client = QdrantClient(
                     host=settings.qdrant.host,
                     port=settings.qdrant.rest_port,
-                    url=settings.qdrant.cloud_url,
+                    grpc_port=settings.qdrant.grpc_port,
+                    prefer_grpc=settings.qdrant.prefer_grpc,
                 )
 
-                raise
+                uri = f"{settings.qdrant.host}:{settings.qdrant.rest_port}"
 
-        return cls._instance
+            logger.info("Connection to Qdrant DB with URI successful: %s", uri)
+        except UnexpectedResponse:
+            logger.exception(
+                "Couldn't connect to Qdrant at host %s, port %s, url %s.",
+                settings.qdrant.host,
+                settings.qdrant.rest_port,
+                settings.qdrant.cloud_url,
+            )
+
+            raise
+
+        return client
 
 
 connection = QdrantDatabaseConnector()
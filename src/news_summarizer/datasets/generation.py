@@ -1,16 +1,19 @@
+import importlib.util
 import json
 import logging
 import re
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import torch
-from pydantic import ValidationError
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from pydantic import TypeAdapter, ValidationError
+from transformers import AutoConfig, AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
 
 from news_summarizer.config import settings
 from news_summarizer.domain.clean_documents import CleanedArticle
@@ -27,6 +30,19 @@ from news_summarizer.utils import RateCalculator, batch
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+TOKENIZE_BATCH_SIZE = 64
+MAX_NEW_TOKENS = 512
+# A summary is a fraction of its article, so shorter articles get a shorter decode budget
+MIN_SUMMARY_TOKENS = 96
+SUMMARY_LENGTH_RATIO = 0.35
+
+# Opening (optionally tagged as json) and closing markdown code fences around the model's JSON
+_MARKDOWN_FENCE_RE = re.compile(r"```(?:json)?\s*|\s*```", re.DOTALL)
+
+# Validate every sample of a run in one call into pydantic's core instead of one model at a time
+_SUMMARY_SAMPLES_ADAPTER = TypeAdapter(List[SummaryDatasetSample])
+_PREFERENCE_SAMPLES_ADAPTER = TypeAdapter(List[PreferenceDatasetSample])
+
 system_prompt_template = """Você é um assistente especializado em resumir notícias
 """
 
@@ -76,6 +92,160 @@ Notícia
 {article}"""
 
 
+# Both generators use the same model, so they share one loaded copy; a single slot means
+# switching to another model frees the previous one instead of holding two LLMs in memory
+@lru_cache(maxsize=1)
+def _load_model_and_tokenizer(
+    model_id: str, device: str, cache_dir: Optional[Path], quantization: str, compile_model: bool
+) -> Tuple[Any, Any]:
+    """Loads the causal language model and its left-padding tokenizer.
+
+    Both generators only do left-padded causal generation, so the tokenizer is shared as well.
+
+    Args:
+        model_id (str): Hugging Face model ID for the LLM.
+        device (str): Target device for model execution ('cpu', 'cuda', etc.).
+        cache_dir (Optional[Path]): Directory for caching model files.
+        quantization (str): One of 'none', 'int8' or 'nf4'.
+        compile_model (bool): Whether to compile the model's forward pass for decoding.
+
+    Returns:
+        Tuple[Any, Any]: The loaded model and tokenizer.
+    """
+    model = _load_model(model_id, device, cache_dir, quantization, compile_model)
+    tokenizer = AutoTokenizer.from_pretrained(
+        model_id,
+        cache_dir=str(cache_dir) if cache_dir else None,
+        padding_side="left",
+    )
+    return model, tokenizer
+
+
+def _load_model(model_id: str, device: str, cache_dir: Optional[Path], quantization: str, compile_model: bool):
+    """Loads the causal language model, optionally with bitsandbytes-quantized weights.
+
+    Decoding is bound by reading the weights once per token, so 8-bit or 4-bit NF4 weights
+    move half or a quarter of the bytes of 16-bit ones.
+
+    Args:
+        model_id (str): Hugging Face model ID for the LLM.
+        device (str): Target device for model execution ('cpu', 'cuda', etc.).
+        cache_dir (Optional[Path]): Directory for caching model files.
+        quantization (str): One of 'none', 'int8' or 'nf4'.
+        compile_model (bool): Whether to compile the model's forward pass for decoding.
+
+    Returns:
+        The loaded causal language model.
+    """
+    dtype = _select_dtype(device)
+    if dtype == torch.bfloat16:
+        # Any float32 matmuls left in the model can then run on the same TF32-capable tensor cores
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+
+    if quantization != "none":
+        _check_quantizable(model_id, cache_dir, quantization)
+
+    if quantization == "none":
+        load_kwargs = {"torch_dtype": dtype}
+    elif quantization == "int8":
+        load_kwargs = {"quantization_config": BitsAndBytesConfig(load_in_8bit=True)}
+    elif quantization == "nf4":
+        load_kwargs = {
+            "quantization_config": BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=dtype,
+                bnb_4bit_use_double_quant=True,
+            )
+        }
+    else:
+        raise ValueError(f"Unsupported quantization: {quantization}")
+
+    model = AutoModelForCausalLM.from_pretrained(
+        model_id,
+        device_map=device,
+        max_memory={0: "8GB"},
+        cache_dir=str(cache_dir) if cache_dir else None,
+        **load_kwargs,
+    )
+
+    # Pin the cheap decode path once instead of per generate call: a single beam, the KV cache
+    # on and plain token tensors back. Sampling settings stay as the model ships them
+    model.generation_config.num_beams = 1
+    model.generation_config.use_cache = True
+    model.generation_config.return_dict_in_generate = False
+
+    if compile_model:
+        _compile_model(model, model_id)
+
+    return model
+
+
+def _check_quantizable(model_id: str, cache_dir: Optional[Path], quantization: str) -> None:
+    """Fails fast when bitsandbytes quantization can't be applied to the checkpoint.
+
+    Args:
+        model_id (str): Hugging Face model ID for the LLM.
+        cache_dir (Optional[Path]): Directory for caching model files.
+        quantization (str): The requested 'int8' or 'nf4' quantization.
+
+    Raises:
+        ImportError: If bitsandbytes is not installed.
+        ValueError: If the checkpoint already ships quantized weights (e.g. AWQ or GPTQ).
+    """
+    if importlib.util.find_spec("bitsandbytes") is None:
+        raise ImportError(
+            f"{quantization} quantization requires bitsandbytes, install it with `poetry install --extras quantization`"
+        )
+
+    config = AutoConfig.from_pretrained(model_id, cache_dir=str(cache_dir) if cache_dir else None)
+    quantization_config = getattr(config, "quantization_config", None)
+    if quantization_config is not None:
+        if isinstance(quantization_config, dict):
+            method = quantization_config.get("quant_method", "unknown")
+        else:
+            method = getattr(quantization_config, "quant_method", "unknown")
+        raise ValueError(
+            f"{model_id} is already quantized ({method}) and can't be loaded with {quantization} quantization, "
+            "set DATASET_GENERATOR_QUANTIZATION=none"
+        )
+
+
+def _select_dtype(device: str) -> torch.dtype:
+    """Picks the 16-bit dtype for weights and compute on the target device.
+
+    bfloat16 costs the same bytes as float16 but keeps float32's range, so it is preferred
+    wherever the GPU supports it (Ampere and newer).
+
+    Args:
+        device (str): Target device for model execution ('cpu', 'cuda', etc.).
+
+    Returns:
+        torch.dtype: torch.bfloat16 if the GPU supports it, torch.float16 otherwise.
+    """
+    if device != "cpu" and torch.cuda.is_available() and torch.cuda.is_bf16_supported():
+        return torch.bfloat16
+    return torch.float16
+
+
+def _compile_model(model, model_id: str) -> None:
+    """Compiles the model's forward pass so each decode step runs as a few fused kernels.
+
+    A static KV cache keeps tensor shapes fixed across steps, letting the compiled graphs
+    (and their CUDA graphs) be reused instead of recompiled as the sequence grows.
+
+    Args:
+        model: The loaded causal language model.
+        model_id (str): Hugging Face model ID, used for logging.
+    """
+    try:
+        model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=False)
+        model.generation_config.cache_implementation = "static"
+    except Exception as exc:
+        logger.warning("Couldn't compile %s, running it eagerly: %s", model_id, exc)
+
+
 @dataclass
 class Response:
     triplets: List[PreferenceDatasetTriplet]
@@ -115,6 +285,8 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
         batch_size: int = 10,
         cache_dir: Optional[Path] = None,
         task: str = "text-generation",
+        quantization: str = settings.dataset.generator_quantization,
+        compile_model: bool = settings.dataset.compile_model,
     ) -> None:
         """Initializes the summarization dataset generator.
 
@@ -125,22 +297,15 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
             batch_size (int): Batch size for prompt processing.
             cache_dir (Optional[Path]): Directory for caching model files.
             task (str): Model task type (default is 'text-generation').
+            quantization (str): Weight quantization, one of 'none', 'int8' or 'nf4'.
+            compile_model (bool): Whether to compile the model with torch.compile.
         """
         self._template = template
         self._model_id = model_id
         self._device = device
 
-        self._model = AutoModelForCausalLM.from_pretrained(
-            self._model_id,
-            torch_dtype=torch.float16,
-            device_map=self._device,
-            max_memory={0: "8GB"},
-            cache_dir=str(cache_dir) if cache_dir else None,
-        )
-        self._tokenizer = AutoTokenizer.from_pretrained(
-            self._model_id,
-            cache_dir=str(cache_dir) if cache_dir else None,
-            padding_side="left",
+        self._model, self._tokenizer = _load_model_and_tokenizer(
+            self._model_id, self._device, cache_dir, quantization, compile_model
         )
 
         self._batch_size = batch_size
@@ -155,11 +320,12 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
         """int: Maximum number of input tokens supported by the model."""
         return self._model.config.max_position_embeddings
 
-    def _is_valid_article(self, content: str) -> bool:
+    def _is_valid_article(self, content: str, num_tokens: int) -> bool:
         """Validates if an article content fits within the model's input limits.
 
         Args:
             content (str): Article content to validate.
+            num_tokens (int): Number of tokens in the article's chat-templated prompt.
 
         Returns:
             bool: True if valid (non-empty and within token limits), False otherwise.
@@ -168,9 +334,6 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
             logger.warning("Empty article detected and skipped.")
             return False
 
-        prompt = self._template.format(article=content)
-        num_tokens = len(self._tokenizer.encode(prompt))
-
         if num_tokens > self.max_input_length:
             logger.warning(
                 "Article too long (%d tokens, max %d). Skipping.",
@@ -181,45 +344,54 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
 
         return True
 
-    def _get_prompt(self, document: CleanedArticle) -> Optional[GenerateDatasetSamplesPrompt]:
+    def _get_prompt(self, document: CleanedArticle, input_ids: List[int]) -> Optional[GenerateDatasetSamplesPrompt]:
         """Generates a single prompt for a document if it is valid.
 
         Args:
             document (CleanedArticle): The cleaned article.
+            input_ids (List[int]): Token ids of the document's chat-templated prompt.
 
         Returns:
             Optional[GenerateDatasetSamplesPrompt]: The prompt object or None if invalid.
         """
-        if not self._is_valid_article(document.content):
+        num_tokens = len(input_ids)
+        if not self._is_valid_article(document.content, num_tokens):
             return None
 
         input_variables = {"article": document.content}
         prompt = self._template.format(**input_variables)
-        num_tokens = len(self._tokenizer.encode(prompt))
 
         return GenerateDatasetSamplesPrompt(
             template=self._template,
             input_variables=input_variables,
             content=prompt,
             num_tokens=num_tokens,
+            input_ids=input_ids,
             data_category="summarization_dataset",
             document=document,
         )
 
-    def _get_prompts(self, documents: list[CleanedArticle]) -> list[GenerateDatasetSamplesPrompt]:
-        """Generates prompts for a list of documents.
+    def _get_prompts(self, documents: Iterable[CleanedArticle]) -> list[GenerateDatasetSamplesPrompt]:
+        """Generates prompts for a stream of documents in a single pass.
 
         Args:
-            documents (list[CleanedArticle]): A list of cleaned articles.
+            documents (Iterable[CleanedArticle]): Cleaned articles, consumed once.
 
         Returns:
             list[GenerateDatasetSamplesPrompt]: List of valid prompts.
         """
         prompts = []
-        for doc in documents:
-            prompt = self._get_prompt(doc)
-            if prompt is not None:
-                prompts.append(prompt)
+        documents = iter(documents)
+        while document_batch := list(islice(documents, TOKENIZE_BATCH_SIZE)):
+            # Tokenize the exact model input once per batch; generation reuses these ids
+            conversations = [self._create_messages(doc.content) for doc in document_batch]
+            batch_input_ids = self._tokenizer.apply_chat_template(
+                conversations, tokenize=True, add_generation_prompt=True, return_dict=True
+            )["input_ids"]
+            for doc, input_ids in zip(document_batch, batch_input_ids, strict=True):
+                prompt = self._get_prompt(doc, input_ids)
+                if prompt is not None:
+                    prompts.append(prompt)
         return prompts
 
     def _create_messages(self, content: str) -> List[Dict[str, str]]:
@@ -243,6 +415,18 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
             },
         ]
 
+    def _max_new_tokens(self, prompt_batch: List[GenerateDatasetSamplesPrompt]) -> int:
+        """Sizes the decode budget of a batch after its longest prompt.
+
+        Args:
+            prompt_batch (List[GenerateDatasetSamplesPrompt]): A batch of prompts.
+
+        Returns:
+            int: Maximum number of tokens to generate for the batch.
+        """
+        longest = max(prompt.num_tokens for prompt in prompt_batch)
+        return min(MAX_NEW_TOKENS, max(MIN_SUMMARY_TOKENS, int(longest * SUMMARY_LENGTH_RATIO)))
+
     def _process_batch(self, prompt_batch: List[GenerateDatasetSamplesPrompt]):
         """Processes a batch of prompts to generate summaries.
 
@@ -252,32 +436,26 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
         Returns:
             List[str]: List of generated summary responses.
         """
-        # Create messages for all prompts in the batch
-        messages_batch = [self._create_messages(prompt.content) for prompt in prompt_batch]
-
-        # Apply chat template and tokenize in batch
-        texts = [
-            self._tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
-            for messages in messages_batch
-        ]
-        model_inputs = self._tokenizer(texts, return_tensors="pt", padding=True, truncation=True).to(self._model.device)
+        # Prompts were tokenized when they were built, so only padding is left to do
+        model_inputs = self._tokenizer.pad(
+            {"input_ids": [prompt.input_ids for prompt in prompt_batch]}, return_tensors="pt"
+        ).to(self._model.device)
 
         with torch.no_grad():
             # Generate responses in batch
-            generated_ids = self._model.generate(**model_inputs, max_new_tokens=512)
-
-        input_lengths = [len(input_ids) for input_ids in model_inputs.input_ids]
+            generated_ids = self._model.generate(
+                **model_inputs,
+                max_new_tokens=self._max_new_tokens(prompt_batch),
+                pad_token_id=self._tokenizer.pad_token_id,
+            )
 
-        # Decode responses and remove input tokens
-        responses = [
-            self._tokenizer.decode(output_ids[input_length:], skip_special_tokens=True)
-            for output_ids, input_length in zip(generated_ids, input_lengths, strict=False)
-        ]
+        # Prompts are left-padded to a common width, so every row's new tokens start at the same column;
+        # slice them off in one op and decode the batch in a single device-to-host copy
+        prompt_length = model_inputs["input_ids"].shape[1]
+        responses = self._tokenizer.batch_decode(generated_ids[:, prompt_length:], skip_special_tokens=True)
 
         del model_inputs, generated_ids
 
-        torch.cuda.empty_cache()
-
         return responses
 
     def _process_batches(self, prompts: List[GenerateDatasetSamplesPrompt]) -> List[Dict[str, str]]:
@@ -290,19 +468,24 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
             Tuple[List[str], List[str]]: Tuple containing article contents and
             their generated summaries.
         """
-        articles, responses = [], []
+        articles = [prompt.input_variables["article"] for prompt in prompts]
+        responses = [None] * len(prompts)
 
         self._start_time = time.time()
         self._counter = 0
 
-        for prompt_batch in batch(prompts, size=self._batch_size):
-            batch_articles = [prompt.input_variables["article"] for prompt in prompt_batch]
-            batch_responses = self._process_batch(prompt_batch)
+        # Batch prompts of similar length together so little of each batch is padding,
+        # then put the responses back in the order of the prompts
+        order = sorted(range(len(prompts)), key=lambda index: prompts[index].num_tokens, reverse=True)
+        for index_batch in batch(order, size=self._batch_size):
+            batch_responses = self._process_batch([prompts[index] for index in index_batch])
 
-            articles.extend(batch_articles)
-            responses.extend(batch_responses)
+            for index, response in zip(index_batch, batch_responses, strict=True):
+                responses[index] = response
+                # The token ids are only needed for generation; drop them as the run goes
+                prompts[index].input_ids = None
 
-            self._counter += self._batch_size
+            self._counter += len(index_batch)
             rate = self._calculate_rate()
             logger.info("Current rate: %.2f prompts/minute", rate)
 
@@ -336,6 +519,15 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
         Returns:
             list[SummaryDatasetSample]: List of valid summary samples.
         """
+        rows = [
+            {"article": article, "summary": response} for article, response in zip(articles, responses, strict=True)
+        ]
+        try:
+            return _SUMMARY_SAMPLES_ADAPTER.validate_python(rows)
+        except ValidationError:
+            # A single invalid row fails the whole call, so validate row by row to keep the valid ones
+            pass
+
         samples = []
         for article, response in zip(articles, responses, strict=True):
             sample = self._parse_summary_sample(article, response)
@@ -356,11 +548,11 @@ class SummarizationDatasetGenerator(DatasetGenerator, RateCalculator):
         samples = self._extract_summaries(articles, responses)
         return SummaryDataset(samples=samples)
 
-    def generate(self, documents: List[CleanedArticle]) -> SummaryDataset:
-        """Generates a summarization dataset from a list of cleaned articles.
+    def generate(self, documents: Iterable[CleanedArticle]) -> SummaryDataset:
+        """Generates a summarization dataset from cleaned articles.
 
         Args:
-            documents (List[CleanedArticle]): List of cleaned article documents.
+            documents (Iterable[CleanedArticle]): Cleaned article documents, consumed once.
 
         Returns:
             SummaryDataset: Dataset containing the article-summary pairs.
@@ -406,6 +598,8 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
         batch_size: int = 10,
         cache_dir: Optional[Path] = None,
         task: str = "text-generation",
+        quantization: str = settings.dataset.generator_quantization,
+        compile_model: bool = settings.dataset.compile_model,
     ) -> None:
         """
         Initialize the PreferenceDatasetGenerator.
@@ -417,22 +611,15 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
             batch_size (int): Number of prompts processed per batch.
             cache_dir (Optional[Path]): Local cache directory for models/tokenizers.
             task (str): Type of task, default is 'text-generation'.
+            quantization (str): Weight quantization, one of 'none', 'int8' or 'nf4'.
+            compile_model (bool): Whether to compile the model with torch.compile.
         """
         self._template = template
         self._model_id = model_id
         self._device = device
 
-        self._model = AutoModelForCausalLM.from_pretrained(
-            self._model_id,
-            torch_dtype=torch.float16,
-            device_map=self._device,
-            max_memory={0: "8GB"},
-            cache_dir=str(cache_dir) if cache_dir else None,
-        )
-        self._tokenizer = AutoTokenizer.from_pretrained(
-            self._model_id,
-            cache_dir=str(cache_dir) if cache_dir else None,
-            padding_side="left",
+        self._model, self._tokenizer = _load_model_and_tokenizer(
+            self._model_id, self._device, cache_dir, quantization, compile_model
         )
 
         self._batch_size = batch_size
@@ -447,12 +634,13 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
         """Returns the maximum input length allowed by the model."""
         return self._model.config.max_position_embeddings
 
-    def _is_valid_article(self, content: str) -> bool:
+    def _is_valid_article(self, content: str, num_tokens: int) -> bool:
         """
         Checks whether the input article is valid for processing.
 
         Args:
             content (str): The article text.
+            num_tokens (int): Number of tokens in the article's chat-templated prompt.
 
         Returns:
             bool: True if valid, False otherwise.
@@ -461,9 +649,6 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
             logger.warning("Empty article detected and skipped.")
             return False
 
-        prompt = self._template.format(article=content)
-        num_tokens = len(self._tokenizer.encode(prompt))
-
         if num_tokens > self.max_input_length:
             logger.warning(
                 "Article too long (%d tokens, max %d). Skipping.",
@@ -474,46 +659,55 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
 
         return True
 
-    def _get_prompt(self, document: CleanedArticle) -> Optional[GenerateDatasetSamplesPrompt]:
+    def _get_prompt(self, document: CleanedArticle, input_ids: List[int]) -> Optional[GenerateDatasetSamplesPrompt]:
         """
         Constructs a prompt for a single document.
 
         Args:
             document (CleanedArticle): The document to generate the prompt from.
+            input_ids (List[int]): Token ids of the document's chat-templated prompt.
 
         Returns:
             GenerateDatasetSamplesPrompt | None: The generated prompt object or None if invalid.
         """
-        if not self._is_valid_article(document.content):
+        num_tokens = len(input_ids)
+        if not self._is_valid_article(document.content, num_tokens):
             return None
 
         input_variables = {"article": document.content}
         prompt = self._template.format(**input_variables)
-        num_tokens = len(self._tokenizer.encode(prompt))
 
         return GenerateDatasetSamplesPrompt(
             template=self._template,
             input_variables=input_variables,
             content=prompt,
             num_tokens=num_tokens,
+            input_ids=input_ids,
             data_category="preference_dataset",
             document=document,
         )
 
-    def _get_prompts(self, documents: list[CleanedArticle]) -> list[GenerateDatasetSamplesPrompt]:
-        """Generates prompts for a list of documents.
+    def _get_prompts(self, documents: Iterable[CleanedArticle]) -> list[GenerateDatasetSamplesPrompt]:
+        """Generates prompts for a stream of documents in a single pass.
 
         Args:
-            documents (list[CleanedArticle]): A list of cleaned articles.
+            documents (Iterable[CleanedArticle]): Cleaned articles, consumed once.
 
         Returns:
             list[GenerateDatasetSamplesPrompt]: List of valid prompts.
         """
         prompts = []
-        for doc in documents:
-            prompt = self._get_prompt(doc)
-            if prompt is not None:
-                prompts.append(prompt)
+        documents = iter(documents)
+        while document_batch := list(islice(documents, TOKENIZE_BATCH_SIZE)):
+            # Tokenize the exact model input once per batch; generation reuses these ids
+            conversations = [self._create_messages(doc.content) for doc in document_batch]
+            batch_input_ids = self._tokenizer.apply_chat_template(
+                conversations, tokenize=True, add_generation_prompt=True, return_dict=True
+            )["input_ids"]
+            for doc, input_ids in zip(document_batch, batch_input_ids, strict=True):
+                prompt = self._get_prompt(doc, input_ids)
+                if prompt is not None:
+                    prompts.append(prompt)
         return prompts
 
     def _create_messages(self, content: str) -> List[Dict[str, str]]:
@@ -537,6 +731,19 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
             },
         ]
 
+    def _max_new_tokens(self, prompt_batch: List[GenerateDatasetSamplesPrompt]) -> int:
+        """
+        Returns the decode budget of a batch, which doesn't shrink with the article
+        since the response is always three triplets.
+
+        Args:
+            prompt_batch (List[GenerateDatasetSamplesPrompt]): A batch of prompts.
+
+        Returns:
+            int: Maximum number of tokens to generate for the batch.
+        """
+        return MAX_NEW_TOKENS
+
     def _process_batch(self, prompt_batch: List[GenerateDatasetSamplesPrompt]):
         """Processes a batch of prompts to generate summaries.
 
@@ -546,32 +753,26 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
         Returns:
             List[str]: List of generated summary responses.
         """
-        # Create messages for all prompts in the batch
-        messages_batch = [self._create_messages(prompt.content) for prompt in prompt_batch]
-
-        # Apply chat template and tokenize in batch
-        texts = [
-            self._tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
-            for messages in messages_batch
-        ]
-        model_inputs = self._tokenizer(texts, return_tensors="pt", padding=True, truncation=True).to(self._model.device)
+        # Prompts were tokenized when they were built, so only padding is left to do
+        model_inputs = self._tokenizer.pad(
+            {"input_ids": [prompt.input_ids for prompt in prompt_batch]}, return_tensors="pt"
+        ).to(self._model.device)
 
         with torch.no_grad():
             # Generate responses in batch
-            generated_ids = self._model.generate(**model_inputs, max_new_tokens=512)
-
-        input_lengths = [len(input_ids) for input_ids in model_inputs.input_ids]
+            generated_ids = self._model.generate(
+                **model_inputs,
+                max_new_tokens=self._max_new_tokens(prompt_batch),
+                pad_token_id=self._tokenizer.pad_token_id,
+            )
 
-        # Decode responses and remove input tokens
-        responses = [
-            self._tokenizer.decode(output_ids[input_length:], skip_special_tokens=True)
-            for output_ids, input_length in zip(generated_ids, input_lengths, strict=False)
-        ]
+        # Prompts are left-padded to a common width, so every row's new tokens start at the same column;
+        # slice them off in one op and decode the batch in a single device-to-host copy
+        prompt_length = model_inputs["input_ids"].shape[1]
+        responses = self._tokenizer.batch_decode(generated_ids[:, prompt_length:], skip_special_tokens=True)
 
         del model_inputs, generated_ids
 
-        torch.cuda.empty_cache()
-
         return responses
 
     def _process_batches(self, prompts: List[GenerateDatasetSamplesPrompt]) -> List[Dict[str, str]]:
@@ -584,21 +785,27 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
             Tuple[List[str], List[str]]: Tuple containing article contents and
             their generated summaries.
         """
-        articles, responses = [], []
+        articles = [prompt.input_variables["article"] for prompt in prompts]
+        responses = [None] * len(prompts)
 
         self._start_time = time.time()
         self._counter = 0
 
-        for prompt_batch in batch(prompts, size=self._batch_size):
-            batch_articles = [prompt.input_variables["article"] for prompt in prompt_batch]
-            batch_responses = self._process_batch(prompt_batch)
+        # Batch prompts of similar length together so little of each batch is padding,
+        # then put the responses back in the order of the prompts
+        order = sorted(range(len(prompts)), key=lambda index: prompts[index].num_tokens, reverse=True)
+        for index_batch in batch(order, size=self._batch_size):
+            batch_responses = self._process_batch([prompts[index] for index in index_batch])
 
-            articles.extend(batch_articles)
-            responses.extend(batch_responses)
+            for index, response in zip(index_batch, batch_responses, strict=True):
+                responses[index] = response
+                # The token ids are only needed for generation; drop them as the run goes
+                prompts[index].input_ids = None
 
-            self._counter += self._batch_size
+            self._counter += len(index_batch)
             rate = self._calculate_rate()
             logger.info("Current rate: %.2f prompts/minute", rate)
+
         return articles, responses
 
     def _clean_markdown_block(self, triplet_str: str) -> Dict[str, Any]:
@@ -611,26 +818,46 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
         Returns:
             Dict[str, Any]: Parsed JSON object.
         """
-        clean_string = re.sub(r"```(?:json)?\s*|\s*```", "", triplet_str, flags=re.DOTALL).strip()
+        # Usually the whole response is a single fenced block, which slicing strips without a regex scan
+        stripped = triplet_str.strip()
+        if stripped.startswith("```") and stripped.endswith("```") and stripped.count("```") == 2:
+            return json.loads(stripped[3:-3].removeprefix("json"))
+
+        clean_string = _MARKDOWN_FENCE_RE.sub("", triplet_str).strip()
         return json.loads(clean_string)
 
-    def _parse_preference_sample(self, article: str, response: str) -> Optional[PreferenceDatasetSample]:
+    def _parse_preference_row(self, article: str, response: str) -> Optional[Dict[str, Any]]:
         """
-        Parses the response string into a PreferenceDatasetSample.
+        Parses the response string into the fields of a PreferenceDatasetSample.
 
         Args:
             article (str): The input article.
             response (str): The LLM response.
 
         Returns:
-            PreferenceDatasetSample | None: The parsed sample or None if parsing fails.
+            Dict[str, Any] | None: The unvalidated sample fields or None if parsing fails.
         """
         try:
             parsed = self._clean_markdown_block(response)
-            sample_dict = {"article": article, "triplets": parsed["triplets"]}
-            return PreferenceDatasetSample(**sample_dict)
+            return {"article": article, "triplets": parsed["triplets"]}
         except (JSONDecodeError, TypeError, KeyError) as err:
             logger.error("Failed to parse triplet JSON: %s", err)
+        except Exception as ex:
+            logger.error("Unexpected error: %s", ex)
+        return None
+
+    def _validate_preference_sample(self, row: Dict[str, Any]) -> Optional[PreferenceDatasetSample]:
+        """
+        Validates parsed sample fields into a PreferenceDatasetSample.
+
+        Args:
+            row (Dict[str, Any]): Sample fields returned by `_parse_preference_row`.
+
+        Returns:
+            PreferenceDatasetSample | None: The validated sample or None if validation fails.
+        """
+        try:
+            return PreferenceDatasetSample(**row)
         except ValidationError as err:
             error_info = err.errors()[0]
             logger.error(
@@ -654,9 +881,21 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
         Returns:
             List[PreferenceDatasetSample]: List of valid samples.
         """
-        samples = []
+        rows = []
         for article, response in zip(articles, responses, strict=False):
-            sample = self._parse_preference_sample(article, response)
+            row = self._parse_preference_row(article, response)
+            if row:
+                rows.append(row)
+
+        try:
+            return _PREFERENCE_SAMPLES_ADAPTER.validate_python(rows)
+        except ValidationError:
+            # A single invalid row fails the whole call, so validate row by row to keep the valid ones
+            pass
+
+        samples = []
+        for row in rows:
+            sample = self._validate_preference_sample(row)
             if sample:
                 samples.append(sample)
         return samples
@@ -675,11 +914,11 @@ class PreferenceDatasetGenerator(DatasetGenerator, RateCalculator):
         samples = self._extract_triplets(articles, responses)
         return PreferenceDataset(samples=samples)
 
-    def generate(self, documents: List[CleanedArticle]) -> PreferenceDataset:
-        """Generates a preference dataset from a list of cleaned articles.
+    def generate(self, documents: Iterable[CleanedArticle]) -> PreferenceDataset:
+        """Generates a preference dataset from cleaned articles.
 
         Args:
-            documents (List[CleanedArticle]): List of cleaned article documents.
+            documents (Iterable[CleanedArticle]): Cleaned article documents, consumed once.
 
         Returns:
             PreferenceDataset: Generated dataset with article-preference-triplet samples.
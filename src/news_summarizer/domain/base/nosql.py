@@ -4,6 +4,7 @@ from abc import ABC
 from typing import Dict, Generic, List, Type, TypeVar
 
 from pydantic import UUID4, BaseModel, Field
+from pymongo.errors import BulkWriteError
 
 from news_summarizer.config import settings
 from news_summarizer.database.mongo import connection
@@ -270,10 +271,19 @@ class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
         """
         collection = _database[cls.get_collection_name()]
         try:
-            collection.insert_many(doc.to_mongo(**kwargs) for doc in documents)
+            # Unordered, so the server can apply the batch in parallel and one bad document doesn't stop the rest
+            collection.insert_many((doc.to_mongo(**kwargs) for doc in documents), ordered=False)
             return True
+        except BulkWriteError as exc:
+            logger.error(
+                "Inserted %d documents of type %s, %d failed",
+                exc.details.get("nInserted", 0),
+                cls.__name__,
+                len(exc.details.get("writeErrors", [])),
+            )
+            return False
         except Exception as exc:
-            logger.error("Failed to insert documents of type %s", cls.__name__, exc)
+            logger.error("Failed to insert documents of type %s: %s", cls.__name__, exc)
             return False
 
     @classmethod
@@ -326,6 +336,46 @@ class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
             logger.error("Failed to retrieve documents")
             return []
 
+    @classmethod
+    def ensure_indexes(cls: Type[T]) -> bool:
+        """
+        Create the single-field indexes declared in the nested Config class.
+
+        Index creation is idempotent, so this is safe to call before every query-heavy step.
+
+        Returns:
+            bool: True if all indexes exist, False if creating any of them failed.
+
+        Example:
+            >>> class NewsArticle(NoSQLBaseDocument):
+            ...     class Config:
+            ...         name = "news_articles"
+            ...         indexes = ("url",)
+            >>> NewsArticle.ensure_indexes()
+            True
+        """
+        collection = _database[cls.get_collection_name()]
+        try:
+            for field in cls.get_indexes():
+                collection.create_index(field)
+            return True
+        except Exception as exc:
+            logger.error("Failed to create indexes for %s: %s", cls.__name__, exc)
+            return False
+
+    @classmethod
+    def get_indexes(cls: Type[T]) -> List[str]:
+        """
+        Return the fields to index, as declared by Config.indexes (defaults to none).
+
+        Example:
+            >>> NewsArticle.get_indexes()
+            ['url']
+        """
+        if not hasattr(cls, "Config") or not hasattr(cls.Config, "indexes"):
+            return []
+        return list(cls.Config.indexes)
+
     @classmethod
     def get_collection_name(cls: Type[T]) -> str:
         """
@@ -1,12 +1,23 @@
 import logging
 import uuid
 from abc import ABC
-from typing import Any, Callable, Dict, Generic, Type, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterable, Type, TypeVar
 from uuid import UUID
 
 import numpy as np
 from pydantic import UUID4, BaseModel, Field
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client.http.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    HnswConfigDiff,
+    MatchAny,
+    PayloadSchemaType,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
 from qdrant_client.models import CollectionInfo, PointStruct, Record
 
 from news_summarizer.database.qdrant import connection
@@ -19,6 +30,8 @@ httpx_logger.setLevel(logging.WARNING)
 
 T = TypeVar("T", bound="VectorBaseDocument")
 
+HNSW_CONFIG = HnswConfigDiff(m=16, ef_construct=200)
+
 
 class VectorBaseDocument(BaseModel, Generic[T], ABC):
     """Abstract base class for vector-enabled documents in Qdrant database.
@@ -204,7 +217,7 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
         return item
 
     @classmethod
-    def bulk_insert(cls: Type[T], documents: list["VectorBaseDocument"]) -> bool:
+    def bulk_insert(cls: Type[T], documents: list["VectorBaseDocument"], wait: bool = True) -> bool:
         """Insert multiple documents into the collection with error handling.
 
         Creates the collection if it doesn't exist, then performs bulk insertion
@@ -212,6 +225,8 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
 
         Args:
             documents (list[VectorBaseDocument]): Documents to insert.
+            wait (bool): Wait until Qdrant has applied the points. Pass False to return
+                once the write is acknowledged. Defaults to True.
 
         Returns:
             bool: True if insertion succeeded, False otherwise.
@@ -232,24 +247,25 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
             return False
 
         try:
-            cls._bulk_insert(documents)
+            cls._bulk_insert(documents, wait=wait)
         except Exception as exc:
             logger.error("Error trying to insert documents: %s.", exc)
             return False
         return True
 
     @classmethod
-    def _bulk_insert(cls: Type[T], documents: list["VectorBaseDocument"]) -> None:
+    def _bulk_insert(cls: Type[T], documents: list["VectorBaseDocument"], wait: bool = True) -> None:
         """Internal method to perform the actual bulk insertion.
 
         Args:
             documents (list[VectorBaseDocument]): Documents to insert.
+            wait (bool): Wait until Qdrant has applied the points.
 
         Raises:
             Exception: If Qdrant insertion fails.
         """
         points = [doc.to_point() for doc in documents]
-        connection.upsert(collection_name=cls.get_collection_name(), points=points)
+        connection.upsert(collection_name=cls.get_collection_name(), points=points, wait=wait)
 
     @classmethod
     def bulk_find(cls: Type[T], limit: int = 10, **kwargs) -> tuple[list[T], UUID | None]:
@@ -330,6 +346,53 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
 
         return documents, next_offset
 
+    @classmethod
+    def find_existing_payload_values(cls: Type[T], key: str, values: Iterable[Any], batch_size: int = 1000) -> set[Any]:
+        """Return the subset of values stored under a payload key by at least one point.
+
+        Lookup failures are raised so callers deciding what to skip never mistake an
+        unreachable collection for an empty one.
+
+        Args:
+            key (str): Payload key to match on.
+            values (Iterable[Any]): Values to look up.
+            batch_size (int): Number of values matched per request. Defaults to 1000.
+
+        Returns:
+            set[Any]: Values found in the collection; empty if the collection doesn't exist yet.
+
+        Raises:
+            Exception: If Qdrant lookup fails.
+
+        Example:
+            >>> embedded = EmbeddedArticleChunk.find_existing_payload_values("document_id", ids)
+        """
+        collection_name = cls.get_collection_name()
+        if not connection.collection_exists(collection_name=collection_name):
+            return set()
+
+        values = list(values)
+        existing_values = set()
+        for start in range(0, len(values), batch_size):
+            scroll_filter = Filter(
+                must=[FieldCondition(key=key, match=MatchAny(any=values[start : start + batch_size]))]
+            )
+            offset = None
+            while True:
+                records, offset = connection.scroll(
+                    collection_name=collection_name,
+                    scroll_filter=scroll_filter,
+                    limit=batch_size,
+                    with_payload=[key],
+                    with_vectors=False,
+                    offset=offset,
+                )
+                existing_values.update(record.payload[key] for record in records)
+                if offset is None:
+                    break
+
+        return existing_values
+
     @classmethod
     def search(cls: Type[T], query_vector: list, limit: int = 10, **kwargs) -> list[T]:
         """Perform vector similarity search with error handling.
@@ -456,12 +519,100 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
         Returns:
             bool: True if collection was created successfully.
         """
+        quantization_config = None
         if use_vector_index is True:
-            vectors_config = VectorParams(size=EmbeddingModel().embedding_size, distance=Distance.COSINE)
+            use_quantization = cls.get_use_quantization()
+            # Quantized collections search the int8 codes kept in RAM and rescore with the float32 originals on disk
+            vectors_config = VectorParams(
+                size=EmbeddingModel().embedding_size, distance=Distance.COSINE, on_disk=use_quantization
+            )
+            if use_quantization:
+                quantization_config = ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+                )
         else:
             vectors_config = {}
 
-        return connection.create_collection(collection_name=collection_name, vectors_config=vectors_config)
+        collection_created = connection.create_collection(
+            collection_name=collection_name,
+            vectors_config=vectors_config,
+            hnsw_config=HNSW_CONFIG if use_vector_index is True else None,
+            quantization_config=quantization_config,
+        )
+
+        # Index payload fields before any points arrive so Qdrant never has to backfill them
+        if collection_created:
+            for field in cls.get_payload_indexes():
+                connection.create_payload_index(
+                    collection_name=collection_name, field_name=field, field_schema=PayloadSchemaType.KEYWORD
+                )
+
+        return collection_created
+
+    @classmethod
+    def ensure_vector_index(cls: Type[T]) -> bool:
+        """Apply the HNSW index parameters to the collection so Qdrant builds the graph on write.
+
+        Collections created with this class already carry these parameters and are left untouched;
+        collections created with Qdrant's defaults are upgraded.
+
+        Returns:
+            bool: True if the collection has these parameters, False if it has no vector index or the update failed.
+
+        Example:
+            >>> NewsArticle.bulk_insert(articles)
+            >>> NewsArticle.ensure_vector_index()
+            True
+        """
+        if not cls.get_use_vector_index():
+            return False
+
+        collection_name = cls.get_collection_name()
+        try:
+            # Only send the update when the stored parameters differ, so a configured collection costs a single read
+            hnsw_config = connection.get_collection(collection_name=collection_name).config.hnsw_config
+            wanted = HNSW_CONFIG.model_dump(exclude_none=True)
+            if all(getattr(hnsw_config, field) == value for field, value in wanted.items()):
+                return True
+
+            return connection.update_collection(collection_name=collection_name, hnsw_config=HNSW_CONFIG)
+        except Exception as exc:
+            logger.error("Failed to update the vector index of %s: %s", collection_name, exc)
+            return False
+
+    @classmethod
+    def ensure_payload_indexes(cls: Type[T]) -> bool:
+        """Create the keyword payload indexes declared in the nested Config class.
+
+        New collections get these indexes on creation; this adds any that are missing
+        from a collection created before they were declared.
+
+        Returns:
+            bool: True if all indexes exist or the collection doesn't exist yet, False if creating any of them failed.
+
+        Example:
+            >>> class NewsChunk(VectorBaseDocument):
+            ...     class Config:
+            ...         name = "news_chunks"
+            ...         payload_indexes = ("document_id",)
+            >>> NewsChunk.ensure_payload_indexes()
+            True
+        """
+        collection_name = cls.get_collection_name()
+        try:
+            if not connection.collection_exists(collection_name=collection_name):
+                return True
+
+            payload_schema = connection.get_collection(collection_name=collection_name).payload_schema
+            for field in cls.get_payload_indexes():
+                if field not in payload_schema:
+                    connection.create_payload_index(
+                        collection_name=collection_name, field_name=field, field_schema=PayloadSchemaType.KEYWORD
+                    )
+            return True
+        except Exception as exc:
+            logger.error("Failed to create payload indexes for %s: %s", collection_name, exc)
+            return False
 
     @classmethod
     def get_category(cls: Type[T]) -> object:
@@ -522,6 +673,38 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
 
         return cls.Config.use_vector_index
 
+    @classmethod
+    def get_use_quantization(cls: Type[T]) -> bool:
+        """Check if this document type stores int8 scalar-quantized vectors.
+
+        Returns:
+            bool: True if scalar quantization is enabled, defaults to True.
+
+        Example:
+            >>> quantized = NewsArticle.get_use_quantization()
+            >>> print(f"Uses int8 quantization: {quantized}")
+        """
+        if not hasattr(cls, "Config") or not hasattr(cls.Config, "use_quantization"):
+            return True
+
+        return cls.Config.use_quantization
+
+    @classmethod
+    def get_payload_indexes(cls: Type[T]) -> list[str]:
+        """Get the payload fields to index, as declared by Config.payload_indexes.
+
+        Returns:
+            list[str]: Payload fields to index, defaults to none.
+
+        Example:
+            >>> NewsChunk.get_payload_indexes()
+            ['document_id']
+        """
+        if not hasattr(cls, "Config") or not hasattr(cls.Config, "payload_indexes"):
+            return []
+
+        return list(cls.Config.payload_indexes)
+
     @classmethod
     def group_by_class(
         cls: Type["VectorBaseDocument"], documents: list["VectorBaseDocument"]
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from datasets import Dataset
 
 from .base import VectorBaseDocument
@@ -14,9 +16,14 @@ class SummaryDatasetSample(VectorBaseDocument):
 class SummaryDataset(VectorBaseDocument):
     samples: list[SummaryDatasetSample]
 
+    def iter_records(self) -> Iterator[dict]:
+        for sample in self.samples:
+            yield sample.model_dump()
+
     def to_hfdataset(self) -> Dataset:
-        data = self.model_dump()
-        dataset = Dataset.from_list(data["samples"])
+        # Build the Arrow table from a generator so records are written out one by one
+        # instead of dumping every sample into one list first
+        dataset = Dataset.from_generator(self.iter_records)
         return dataset
 
     class Config:
@@ -43,9 +50,14 @@ class PreferenceDatasetSample(VectorBaseDocument):
 class PreferenceDataset(VectorBaseDocument):
     samples: list[PreferenceDatasetSample]
 
+    def iter_records(self) -> Iterator[dict]:
+        for sample in self.samples:
+            yield sample.model_dump()
+
     def to_hfdataset(self) -> Dataset:
-        data = self.model_dump()
-        dataset = Dataset.from_list(data["samples"])
+        # Build the Arrow table from a generator so records are written out one by one
+        # instead of dumping every sample into one list first
+        dataset = Dataset.from_generator(self.iter_records)
         return dataset
 
     class Config:
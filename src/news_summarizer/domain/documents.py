@@ -22,6 +22,7 @@ class Link(NoSQLBaseDocument):
 
     class Config:
         name = "link"
+        indexes = ("url",)
 
 
 class Article(NoSQLBaseDocument):
@@ -38,3 +39,4 @@ class Article(NoSQLBaseDocument):
 
     class Config:
         name = "article"
+        indexes = ("url",)
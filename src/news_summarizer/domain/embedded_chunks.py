@@ -20,6 +20,7 @@ class EmbeddedArticleChunk(VectorBaseDocument, ABC):
 
     class Config:
         name = "embedded_article_chunks"
+        payload_indexes = ("document_id",)
 
     @classmethod
     def to_context(cls, chunks: list["EmbeddedArticleChunk"]) -> str:
@@ -15,3 +15,4 @@ class Prompt(VectorBaseDocument):
 class GenerateDatasetSamplesPrompt(Prompt):
     data_category: str
     document: CleanedArticle
+    input_ids: list[int] | None = None
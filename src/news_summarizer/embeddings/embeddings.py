@@ -1,16 +1,20 @@
+import logging
 from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 from numpy.typing import NDArray
-from sentence_transformers.SentenceTransformer import SentenceTransformer
-from transformers import AutoTokenizer
 
 from news_summarizer.config import settings
 
 from .base import SingletonBase
 
+if TYPE_CHECKING:
+    from transformers import AutoTokenizer
+
+logger = logging.getLogger(__name__)
+
 
 class EmbeddingModel(SingletonBase):
     def __init__(
@@ -18,7 +22,13 @@ class EmbeddingModel(SingletonBase):
         model_id: str = settings.rag.embedding_model_id,
         device: str = settings.rag.model_device,
         cache_dir: Optional[Path] = None,
+        precision: str = settings.rag.model_precision,
+        compile_model: bool = settings.rag.compile_model,
+        use_autocast: bool = settings.rag.use_autocast,
     ) -> None:
+        # sentence-transformers pulls in torch and transformers, so import it only when a model is built
+        from sentence_transformers.SentenceTransformer import SentenceTransformer
+
         self._model_id = model_id
         self._device = device
 
@@ -29,29 +39,86 @@ class EmbeddingModel(SingletonBase):
         )
         self._model.eval()
 
+        if precision != "float32":
+            self._set_precision(precision)
+
+        if compile_model:
+            self._compile_transformer()
+
+        self._autocast_dtype = self._select_autocast_dtype() if use_autocast else None
+
+    def _set_precision(self, precision: str) -> None:
+        import torch
+
+        if precision == "int8":
+            if self._model.device.type != "cpu":
+                logger.warning("int8 dynamic quantization only runs on CPU, keeping %s in float32", self._model_id)
+                return
+            # Quantize the linear layers' weights; activations are quantized on the fly at each call
+            transformer = self._model[0]
+            transformer.auto_model = torch.ao.quantization.quantize_dynamic(
+                transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif precision in ("float16", "bfloat16"):
+            self._model.to(dtype=getattr(torch, precision))
+        else:
+            raise ValueError(f"Unsupported model precision: {precision}")
+
+    def _select_autocast_dtype(self):
+        import torch
+
+        if self._model.device.type != "cuda":
+            logger.warning("Autocast is only used on CUDA, running %s without it", self._model_id)
+            return None
+        # bf16 keeps float32's range, so prefer it where the GPU supports it
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+    def _compile_transformer(self) -> None:
+        import torch
+
+        # Compile the underlying transformer rather than the wrapper so `encode` keeps working;
+        # batches vary in length, so let the compiled graph take dynamic shapes
+        transformer = self._model[0]
+        try:
+            transformer.auto_model = torch.compile(transformer.auto_model, dynamic=True)
+        except Exception as exc:
+            logger.warning("Couldn't compile %s, running it eagerly: %s", self._model_id, exc)
+
     @property
     def model_id(self) -> str:
         return self._model_id
 
     @cached_property
     def embedding_size(self) -> int:
-        dummy_embedding = self._model.encode("", show_progress_bar=False)
-        return dummy_embedding.shape[0]
+        # Read the size from the model config; only fall back to a dummy forward pass if it is unknown
+        embedding_size = self._model.get_sentence_embedding_dimension()
+        if embedding_size is None:
+            embedding_size = self._model.encode("", show_progress_bar=False).shape[0]
+        return embedding_size
 
     @property
     def max_input_length(self) -> int:
         return self._model.max_seq_length
 
     @property
-    def tokenizer(self) -> AutoTokenizer:
+    def tokenizer(self) -> "AutoTokenizer":
         return self._model.tokenizer
 
     def __call__(
-        self, input_text: str | list[str], to_list: bool = True
+        self, input_text: str | list[str], to_list: bool = True, batch_size: int = 32
     ) -> NDArray[np.float32] | list[float] | list[list[float]]:
+        import torch
+
+        autocast = torch.autocast(
+            device_type="cuda", dtype=self._autocast_dtype, enabled=self._autocast_dtype is not None
+        )
+
         try:
-            embeddings = self._model.encode(input_text, show_progress_bar=False)
-        except Exception:
+            # inference_mode also skips the version-counter bookkeeping that no_grad inside encode keeps
+            with torch.inference_mode(), autocast:
+                embeddings = self._model.encode(input_text, batch_size=batch_size, show_progress_bar=False)
+        except Exception as exc:
+            logger.error("Error generating embeddings with %s: %s", self._model_id, exc)
             return [] if to_list else np.array([])
 
         if to_list:
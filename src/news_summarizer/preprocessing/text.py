@@ -1,11 +1,26 @@
 import re
 import unicodedata
+from typing import Iterable, List, Optional
+
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001f600-\U0001f64f"  # emoticons
+    "\U0001f300-\U0001f5ff"  # symbols & pictographs
+    "\U0001f680-\U0001f6ff"  # transport & map symbols
+    "\U0001f1e0-\U0001f1ff"  # flags (iOS)
+    "]+",
+    flags=re.UNICODE,
+)
+MULTIPLE_SPACES_PATTERN = re.compile(r"\s+")
 
 
 class TextTransformation:
     def apply(self, text: str) -> str:
         raise NotImplementedError
 
+    def apply_many(self, texts: List[str]) -> List[str]:
+        return [self.apply(text) for text in texts]
+
 
 class StripWhitespace(TextTransformation):
     def apply(self, text: str) -> str:
@@ -14,26 +29,19 @@ class StripWhitespace(TextTransformation):
 
 class RemoveEmojis(TextTransformation):
     def apply(self, text: str) -> str:
-        emoji_pattern = re.compile(
-            "["
-            "\U0001f600-\U0001f64f"  # emoticons
-            "\U0001f300-\U0001f5ff"  # symbols & pictographs
-            "\U0001f680-\U0001f6ff"  # transport & map symbols
-            "\U0001f1e0-\U0001f1ff"  # flags (iOS)
-            "]+",
-            flags=re.UNICODE,
-        )
-        return emoji_pattern.sub(r"", text)
+        return EMOJI_PATTERN.sub(r"", text)
 
 
 class RemoveNonAsciiExceptAccents(TextTransformation):
     def apply(self, text: str) -> str:
+        if text.isascii():
+            return text
         return "".join(c for c in text if ord(c) < 128 or unicodedata.category(c).startswith("L"))
 
 
 class ReplaceMultipleSpaces(TextTransformation):
     def apply(self, text: str) -> str:
-        return re.sub(r"\s+", " ", text)
+        return MULTIPLE_SPACES_PATTERN.sub(" ", text)
 
 
 class TextPipeline:
@@ -50,6 +58,13 @@ class TextPipeline:
             text = transformation.apply(text)
         return text
 
+    def execute_many(self, texts: Iterable[Optional[str]]) -> List[str]:
+        """Run the pipeline over a whole column of texts, one transformation at a time."""
+        texts = ["" if text is None else text for text in texts]
+        for transformation in self.transformations:
+            texts = transformation.apply_many(texts)
+        return texts
+
 
 # Example usage
 pipeline = TextPipeline()
@@ -1,3 +1,3 @@
-from ._base import RateCalculator, batch, clean_html, device_selector
+from ._base import RateCalculator, batch, clean_html, device_selector, is_hashable
 
-__all__ = ["batch", "device_selector", "clean_html", "RateCalculator"]
+__all__ = ["batch", "device_selector", "clean_html", "RateCalculator", "is_hashable"]
@@ -1,14 +1,14 @@
 import time
 from typing import Generator
 
-import torch
-
 
 def batch(list_: list, size: int) -> Generator[list, None, None]:
     yield from (list_[i : i + size] for i in range(0, len(list_), size))
 
 
 def device_selector() -> str:
+    import torch  # deferred: torch takes seconds to import and most callers never need it
+
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
     return device
 
@@ -17,6 +17,14 @@ def batch_size_selector():
     pass
 
 
+def is_hashable(value) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 def clean_html(soup):
     # Remove style and script elements
     for tag in soup(["style", "script"]):
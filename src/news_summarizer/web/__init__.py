@@ -2,6 +2,7 @@ from .crawler import (
     BandCrawler,
     CrawlerExecutor,
     G1Crawler,
+    G1FeedCrawler,
     R7Crawler,
     crawler_registry,
 )
@@ -25,6 +26,7 @@ __all__ = [
     "ScraperExecutor",
     "crawler_registry",
     "G1Crawler",
+    "G1FeedCrawler",
     "BandCrawler",
     "R7Crawler",
     "BBCBrasilCralwer",
@@ -1,16 +1,21 @@
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Semaphore
-from typing import Callable, Dict, List, Type
-from urllib.parse import urlparse
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache
+from threading import Lock, local
+from typing import Dict, Iterable, Iterator, List, Sized, Tuple, Type
+from urllib.parse import urlsplit
 
 # Assuming RateCalculator is abstract and does not mix other responsibilities
 from news_summarizer.utils import RateCalculator
+from news_summarizer.webdriver import ShutilBrowserLocator, WebDriverFactory
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared by every crawler and scraper so the browser lookup happens once per process
+webdriver_factory = WebDriverFactory(ShutilBrowserLocator())
+
 
 # Abstract BaseRegistry class to handle the core logic
 class BaseRegistry:
@@ -18,67 +23,157 @@ class BaseRegistry:
         self._components: Dict[str, Type] = {}
 
     def register(self, name: str, component: Type) -> None:
-        if name in self._components:
+        host = _extract_host(name)
+        if host in self._components:
             raise ValueError(f"Component '{name}' is already registered.")
 
         logger.debug("Registering component: %s", name)
-        self._components[name] = component
+        self._components[host] = component
 
     def get(self, name: str):
-        parsed_domain = urlparse(name)
-        netloc = self._extract_netloc(parsed_domain)
+        host = _extract_host(name)
 
-        if netloc not in self._components:
+        if host not in self._components:
             raise KeyError(f"Component for '{name}' not found.")
-        return self._components[netloc]()
-
-    def _extract_netloc(self, domain):
-        return f"{domain.scheme}://{domain.netloc}/"
+        return self._components[host]()
 
     def list_components(self):
         return list(self._components.keys())
 
 
+@lru_cache(maxsize=4096)
+def _extract_host(url: str) -> str:
+    # Executors resolve every link through the registry, so memoize the split per URL.
+    # Keying by bare host lets http/https and www/non-www links reach the same component.
+    return urlsplit(url).netloc.lower().removeprefix("www.")
+
+
 # Interface for any kind of executor
 class BaseExecutor(RateCalculator):
+    # When set, each host's links run one after another on a single worker, so they share one component
+    group_by_host: bool = False
+
     def __init__(self, registry, max_concurrent: int, max_workers: int) -> None:
         self.registry = registry
-        self.semaphore = Semaphore(max_concurrent)
-        self.max_workers = max_workers
+        # Threads beyond the concurrency limit would only sit blocked, so the pool itself is the limit
+        self.max_workers = min(max_concurrent, max_workers)
         self._start_time = None
         self._counter = None
+        # Components (and their browsers) live for one run, at most one open per worker thread
+        self._local = local()
+        self._components = []
+        self._components_lock = Lock()
+
+    def run(self, links: Iterable[str]) -> Dict[str, bool]:
+        """Run every link, accepting any iterable so callers can stream links while earlier ones run."""
+        return dict(self.run_iter(links))
+
+    def run_iter(self, links: Iterable[str]) -> Iterator[Tuple[str, bool]]:
+        """Yield (link, result) pairs as tasks complete, so callers don't have to hold every result."""
+        if isinstance(links, Sized) and not links:
+            return
+
+        if self.group_by_host:
+            batches = _group_by_host(links)
+        elif isinstance(links, Sized):
+            batches = [[link] for link in links]
+        else:
+            batches = ([link] for link in links)
+
+        # Never spin up more threads than there are batches to process
+        max_workers = min(self.max_workers, len(batches)) if isinstance(batches, Sized) else self.max_workers
 
-    def run(self, links: List[str]) -> Dict[str, bool]:
-        results = {}
         self._start_time = time.time()
         self._counter = 0
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(self._task_wrapper, self._run, link): link for link in links}
-
-            for future in as_completed(futures):
-                link = futures[future]
-                try:
-                    result = future.result()
-                    results[link] = result
-
-                    self._counter += 1
-                    rate = self._calculate_rate()
-                    logger.info("Current rate: %.2f tasks/minute", rate)
-
-                    logger.debug("Task completed with result: %s", result)
-                except Exception as e:
-                    logger.error("Error occurred during task execution: %s", e)
-                    results[link] = False
-        return results
-
-    def _task_wrapper(self, function: Callable, *args, **kwargs) -> None:
-        with self.semaphore:
-            logger.debug("Semaphore acquired.")
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = set()
+                for batch in batches:
+                    # Keep only a bounded number of tasks queued so a lazy source is pulled as workers free up
+                    if len(futures) >= max_workers * 2:
+                        done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from self._collect(future)
+                    futures.add(executor.submit(self._run_batch, batch))
+
+                for future in as_completed(futures):
+                    yield from self._collect(future)
+        finally:
+            self._close_components()
+
+    def _collect(self, future: Future) -> Iterable[Tuple[str, bool]]:
+        batch_results = future.result()
+
+        self._counter += len(batch_results)
+        rate = self._calculate_rate()
+        logger.info("Current rate: %.2f tasks/minute", rate)
+
+        logger.debug("Tasks completed with results: %s", batch_results)
+        return batch_results.items()
+
+    def _run_batch(self, links: List[str]) -> Dict[str, bool]:
+        results = {}
+        for link in links:
             try:
-                return function(*args, **kwargs)
-            finally:
-                logger.debug("Semaphore released.")
+                results[link] = self._run(link)
+            except Exception as e:
+                logger.error("Error occurred during task execution: %s", e)
+                results[link] = False
+        return results
 
     def _run(self, link: str) -> bool:
         raise NotImplementedError
+
+    def _get_component(self, link: str):
+        # Selenium drivers are not thread-safe, so each worker thread keeps its own component. Only the one
+        # for the host it is working on stays open, which caps live browsers at one per worker
+        host = _extract_host(link)
+        if getattr(self._local, "component", None) is not None and self._local.host == host:
+            return self._local.component
+
+        self._release_thread_component()
+        component = self.registry.get(link)
+        self._local.host, self._local.component = host, component
+        with self._components_lock:
+            self._components.append(component)
+        return component
+
+    def _discard_component(self, link: str) -> None:
+        # A failed task may leave the browser unusable, so the next link of the host gets a new one
+        self._release_thread_component()
+
+    def _release_thread_component(self) -> None:
+        component = getattr(self._local, "component", None)
+        if component is None:
+            return
+        self._local.component = None
+        with self._components_lock:
+            self._components.remove(component)
+        _close_component(component)
+
+    def _close_components(self) -> None:
+        """Close every component still open once a run is over.
+
+        Components keep their resources (e.g. a Selenium driver) open across links, so their
+        ``close`` is only called here or when a worker discards or replaces one.
+        """
+        with self._components_lock:
+            components, self._components = self._components, []
+        for component in components:
+            _close_component(component)
+        self._local = local()
+
+
+def _group_by_host(links: Iterable[str]) -> List[List[str]]:
+    batches = {}
+    for link in links:
+        batches.setdefault(_extract_host(link), []).append(link)
+    return list(batches.values())
+
+
+def _close_component(component) -> None:
+    try:
+        component.close()
+    except Exception as exc:
+        logger.warning("Error closing %s: %s", type(component).__name__, exc)
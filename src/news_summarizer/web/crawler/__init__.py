@@ -1,5 +1,13 @@
 from .executor import CrawlerExecutor
-from .newspaper_website import BandCrawler, G1Crawler, R7Crawler
+from .newspaper_website import BandCrawler, G1Crawler, G1FeedCrawler, R7Crawler
 from .registry import crawler_registry
 
-__all__ = ["crawler_registry", "G1Crawler", "BandCrawler", "R7Crawler", "BBCBrasilCralwer", "CrawlerExecutor"]
+__all__ = [
+    "crawler_registry",
+    "G1Crawler",
+    "G1FeedCrawler",
+    "BandCrawler",
+    "R7Crawler",
+    "BBCBrasilCralwer",
+    "CrawlerExecutor",
+]
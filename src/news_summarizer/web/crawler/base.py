@@ -1,7 +1,25 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from typing import Optional
+
+import aiohttp
 
 from news_summarizer.domain.base import NoSQLBaseDocument
-from news_summarizer.webdriver import ShutilBrowserLocator, WebDriverFactory
+
+from ..base import webdriver_factory
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = 30
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_CONNECTION_LIMIT = 20
+DNS_CACHE_TTL = 3600
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko)",
+    "Connection": "keep-alive",
+}
 
 
 class BaseCrawler(ABC):
@@ -11,9 +29,55 @@ class BaseCrawler(ABC):
     def search(self, link: str, **kwargs) -> None:
         raise NotImplementedError
 
+    def close(self) -> None:
+        return None
+
 
 class BaseSeleniumCrawler(BaseCrawler, ABC):
     def __init__(self, scroll_limit: int = 5) -> None:
-        self.driver = WebDriverFactory(ShutilBrowserLocator()).get_webdriver()
+        self.driver = webdriver_factory.get_webdriver()
         self.scroll_limit = scroll_limit
         self.soup = None
+
+    def close(self) -> None:
+        self.driver.quit()
+
+
+class BaseAsyncCrawler(BaseCrawler, ABC):
+    def __init__(self, scroll_limit: int = 5, max_concurrent_requests: int = 5) -> None:
+        self.scroll_limit = scroll_limit
+        self.max_concurrent_requests = max_concurrent_requests
+
+    def search(self, link: str, **kwargs) -> None:
+        # Executors call crawlers from worker threads, which have no running event loop of their own
+        asyncio.run(self.asearch(link, **kwargs))
+
+    @abstractmethod
+    async def asearch(self, link: str, **kwargs) -> None:
+        raise NotImplementedError
+
+    def create_session(self) -> aiohttp.ClientSession:
+        # One pooled session per crawl, so every page of a site reuses the same kept-alive connections
+        connector = aiohttp.TCPConnector(limit=HTTP_CONNECTION_LIMIT, ttl_dns_cache=DNS_CACHE_TTL)
+        timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=HTTP_HEADERS)
+
+    async def fetch(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str) -> Optional[str]:
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            try:
+                async with semaphore, session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.text()
+            except aiohttp.ClientResponseError as exc:
+                # Client errors such as a 404 past the last page won't change on retry
+                if exc.status < 500 or attempt == HTTP_MAX_RETRIES:
+                    logger.warning("Failed to fetch %s: %s", url, exc)
+                    return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                if attempt == HTTP_MAX_RETRIES:
+                    logger.warning("Failed to fetch %s: %s", url, exc)
+                    return None
+
+            await asyncio.sleep(HTTP_BACKOFF_FACTOR * 2**attempt)
+
+        return None
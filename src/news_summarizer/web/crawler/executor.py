@@ -9,6 +9,9 @@ logger = logging.getLogger(__name__)
 
 # CrawlerExecutor now only focuses on running the crawler tasks
 class CrawlerExecutor(BaseExecutor):
+    # Sections of a site are few and slow to crawl, so walk them with one browser per site
+    group_by_host = True
+
     def __init__(
         self, crawler_registry: CrawlerRegistry, max_concurrent_crawlers: int = 4, max_workers: int = 6
     ) -> None:
@@ -16,7 +19,7 @@ class CrawlerExecutor(BaseExecutor):
 
     def _run(self, link: str) -> bool:
         logger.info("Starting crawler for link: %s", link)
-        crawler = self.registry.get(link)
+        crawler = self._get_component(link)
         if not crawler:
             logger.error("No crawler registered for link: %s", link)
             return False
@@ -26,4 +29,5 @@ class CrawlerExecutor(BaseExecutor):
             return True
         except Exception as ex:
             logger.error("Task failed: %s, %s", link, ex)
+            self._discard_component(link)
             return False
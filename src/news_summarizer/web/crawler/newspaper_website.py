@@ -1,12 +1,15 @@
+import asyncio
 import logging
 import re
 import time
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from pydantic import AnyUrl, TypeAdapter, ValidationError
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,7 +17,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from news_summarizer.domain.documents import Link
 from news_summarizer.utils import clean_html
 
-from .base import BaseSeleniumCrawler
+from .base import BaseAsyncCrawler, BaseSeleniumCrawler
 
 logging.basicConfig(level=logging.debug)
 logger = logging.getLogger(__name__)
@@ -23,51 +26,82 @@ MAX_RETRIES = 5
 MAX_REPEATED_PAGE_COUNT = 10
 TIMEOUT = 300
 
+# Compiled once, these run for every link a crawl yields
+_SLASHED_DATE_RE = re.compile(r"(\d{4}/\d{2}/\d{2})")
+_COMPACT_DATE_RE = re.compile(r"(\d{2}\d{2}\d{4})")
+_EXTENSION_RE = re.compile(r"\.html?|\.htm|\.ghtml$")
+_SEPARATOR_RE = re.compile(r"[-_]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_FEED_PAGE_RE = re.compile(r"pagina-(\d+)")
+_QUERY_PAGE_RE = re.compile(r"\?page=(\d+)")
+
+_URL_ADAPTER = TypeAdapter(AnyUrl)
+_ANCHOR_STRAINER = SoupStrainer("a", href=True)
+
+SCROLL_TO_BOTTOM_SCRIPT = (
+    "window.scrollTo(0, document.body.scrollHeight);"
+    "return window.pageYOffset + window.innerHeight >= document.body.scrollHeight;"
+)
+
 
 def extract_date_from_url(url: str) -> str:
     # Regular expression to match the date in the format YYYY/MM/DD
 
     try:
-        pattern0 = r"(\d{4}/\d{2}/\d{2})"
-        pattern1 = r"(\d{2}\d{2}\d{4})"
-
-        match = re.search(pattern0, url)
+        match = _SLASHED_DATE_RE.search(url)
 
         if match:
             date_str = match.group(0)
             # Convert the date string to a datetime object
-            return datetime.strptime(date_str, "%Y/%m/%d")
+            return _parse_date(date_str, "%Y/%m/%d")
 
-        match = re.search(pattern1, url)
+        match = _COMPACT_DATE_RE.search(url)
 
         if match:
             date_str = match.group(0)
             # Convert the date string to a datetime object
-            return datetime.strptime(date_str, "%d%m%Y")
+            return _parse_date(date_str, "%d%m%Y")
     except Exception:
         logger.error("Error trying to parse date for %s", url)
     return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str, date_format: str) -> datetime:
+    # Links from the same day share the date string, and datetimes are immutable, so reuse the parse
+    return datetime.strptime(date_str, date_format)
+
+
 def extract_title(url: str) -> str:
     last_segment = url.rsplit("/", 1)[-1]
 
     # Remove HTML-like extensions
-    last_segment = re.sub(r"\.html?|\.htm|\.ghtml$", "", last_segment)
+    last_segment = _EXTENSION_RE.sub("", last_segment)
 
     # Replace separators (-, _, etc.) with spaces and convert to lowercase
-    title = re.sub(r"[-_]", " ", last_segment)
+    title = _SEPARATOR_RE.sub(" ", last_segment)
 
     # Optional: Replace multiple spaces with a single space
-    title = re.sub(r"\s+", " ", title).strip()
+    title = _WHITESPACE_RE.sub(" ", title).strip()
 
     return title
 
 
+def find_anchors(page_source: str) -> List[Tag]:
+    # Links are all the crawlers keep from a page, so only anchors are built into the tree
+    soup = BeautifulSoup(page_source, "html.parser", parse_only=_ANCHOR_STRAINER)
+    return clean_html(soup).find_all("a", href=True)
+
+
 def extract_links(elements: List[Tag]):
     data = []
+    # Homepages repeat the same article across menus, cards and related blocks; keep the first one
+    seen_urls = set()
     for element in elements:
         url = element.get("href")
+        if not url or url in seen_urls:
+            continue
+        seen_urls.add(url)
 
         title = element.get_text(strip=True)
         if len(title) < 5:
@@ -86,6 +120,48 @@ def extract_links(elements: List[Tag]):
     return data
 
 
+def build_links(hyperlinks: List[dict], source: str) -> List[Link]:
+    links = []
+    for hyperlink in hyperlinks:
+        url = _validate_url(hyperlink["url"])
+        if url is None:
+            logger.error(
+                "Failed to append hyperlink with title '%s' and URL '%s'",
+                hyperlink.get("title", "N/A"),
+                hyperlink.get("url", "N/A"),
+            )
+            continue
+
+        # extract_links already yields a str title and an optional datetime, so the URL is
+        # the only field that needs validating and the model can be built without a full pass
+        links.append(
+            Link.model_construct(
+                title=hyperlink["title"],
+                url=url,
+                source=source,
+                published_at=hyperlink["published_at"],
+            )
+        )
+
+    return links
+
+
+def _validate_url(url: str) -> Optional[AnyUrl]:
+    try:
+        return _URL_ADAPTER.validate_python(url)
+    except ValidationError:
+        return None
+
+
+def scroll_to_bottom(driver, timeout: int = 10) -> None:
+    # Scrolling and checking the position in one script costs a single round-trip per poll
+    WebDriverWait(driver, timeout).until(lambda d: d.execute_script(SCROLL_TO_BOTTOM_SCRIPT))
+
+
+def wait_for_document_ready(driver, timeout: int = 10) -> None:
+    WebDriverWait(driver, timeout).until(lambda d: d.execute_script("return document.readyState") == "complete")
+
+
 class G1Crawler(BaseSeleniumCrawler):
     model = Link
 
@@ -116,13 +192,7 @@ class G1Crawler(BaseSeleniumCrawler):
 
             try:
                 logger.debug("Scrolling page down.")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script(
-                        "return window.pageYOffset + window.innerHeight >= document.body.scrollHeight"
-                    )
-                )
+                scroll_to_bottom(self.driver)
 
                 logger.debug("Waiting for the button to be clickable.")
 
@@ -165,7 +235,14 @@ class G1Crawler(BaseSeleniumCrawler):
 
                 logger.debug("Loading more content.")
                 self.driver.execute_script("arguments[0].click()", load_more_button)
-                time.sleep(1)
+                # Move on as soon as the button points at the next feed page instead of sleeping blindly
+                WebDriverWait(
+                    self.driver, 10, ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+                ).until(
+                    lambda driver, clicked_url=url: (
+                        driver.find_element(By.CSS_SELECTOR, "div.load-more a").get_dom_attribute("href") != clicked_url
+                    )
+                )
 
             except TimeoutException:
                 retry_count += 1
@@ -176,7 +253,7 @@ class G1Crawler(BaseSeleniumCrawler):
                 break
 
     def _extract_page_number(self, url):
-        match = re.search(r"pagina-(\d+)", url)
+        match = _FEED_PAGE_RE.search(url)
         page_number = int(match.group(1))
 
         if isinstance(page_number, int):
@@ -195,43 +272,64 @@ class G1Crawler(BaseSeleniumCrawler):
             logger.debug("Crawling link: %s", link)
             self.driver.get(link)
             WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "footer")))
-            time.sleep(2)
+            wait_for_document_ready(self.driver)
             self.accept_cookies()
-            time.sleep(2)
             self.scroll_page()
 
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            soup = clean_html(soup)
-            elements = soup.find_all("a", href=True)
+            elements = find_anchors(self.driver.page_source)
             hyperlinks = extract_links(elements)
-            self.driver.close()
-
-            hyperlink_list = []
-            for hyperlink in hyperlinks:
-                try:
-                    hyperlink_list.append(
-                        Link(
-                            title=hyperlink["title"],
-                            url=hyperlink["url"],
-                            source=link,
-                            published_at=hyperlink["published_at"],
-                        )
-                    )
-                except ValueError:
-                    logger.error(
-                        "Failed to append hyperlink with title '%s' and URL '%s'",
-                        hyperlink.get("title", "N/A"),
-                        hyperlink.get("url", "N/A"),
-                    )
-                    continue
+
+            hyperlink_list = build_links(hyperlinks, source=link)
 
             logger.debug("Found %s hyperlinks on '%s'", len(hyperlink_list), link)
             self.model.bulk_insert(hyperlink_list)
         except Exception as ex:
             logger.error("Error while crawling domain %s: %s", link, ex)
             raise
+
+
+class G1FeedCrawler(BaseAsyncCrawler):
+    """Crawl G1 sections through their server-rendered feed pages instead of clicking "load more"."""
+
+    model = Link
+
+    def __init__(self, scroll_limit: int = 50, max_concurrent_requests: int = 5) -> None:
+        super().__init__(scroll_limit=scroll_limit, max_concurrent_requests=max_concurrent_requests)
+
+    def _page_urls(self, link: str) -> List[str]:
+        # "Load more" points at <section>/index/feed/pagina-N.ghtml, so every page can be requested up front
+        section = link.rstrip("/")
+        return [link] + [f"{section}/index/feed/pagina-{page}.ghtml" for page in range(2, self.scroll_limit + 1)]
+
+    async def asearch(self, link: str, **kwargs) -> None:
+        logger.debug("Crawling link: %s", link)
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async with self.create_session() as session:
+            pages = await asyncio.gather(*(self.fetch(session, semaphore, url) for url in self._page_urls(link)))
+
+        elements = []
+        for page in pages:
+            if page:
+                elements.extend(find_anchors(page))
+        hyperlinks = extract_links(elements)
+
+        if not hyperlinks:
+            # The feed markup changed or now needs JavaScript, so drive a browser instead
+            logger.warning("No links found in the feed of %s, falling back to Selenium.", link)
+            await asyncio.to_thread(self._search_with_browser, link)
+            return
+
+        hyperlink_list = build_links(hyperlinks, source=link)
+        logger.debug("Found %s hyperlinks on '%s'", len(hyperlink_list), link)
+        self.model.bulk_insert(hyperlink_list)
+
+    def _search_with_browser(self, link: str) -> None:
+        crawler = G1Crawler(scroll_limit=self.scroll_limit)
+        try:
+            crawler.search(link)
         finally:
-            self.driver.close()
+            crawler.close()
 
 
 class BandCrawler(BaseSeleniumCrawler):
@@ -264,13 +362,7 @@ class BandCrawler(BaseSeleniumCrawler):
 
             try:
                 logger.debug("Scrolling page down.")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script(
-                        "return window.pageYOffset + window.innerHeight >= document.body.scrollHeight"
-                    )
-                )
+                scroll_to_bottom(self.driver)
 
                 logger.debug("Waiting for the button to be clickable.")
 
@@ -310,7 +402,15 @@ class BandCrawler(BaseSeleniumCrawler):
 
                 logger.debug("Loading more content.")
                 self.driver.execute_script("arguments[0].click()", load_more_button)
-                time.sleep(2)
+                # The button advances its data-page once the next batch is in, so wait for that
+                WebDriverWait(
+                    self.driver, 10, ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+                ).until(
+                    lambda driver, clicked_page=str(page_number): (
+                        driver.find_element(By.CSS_SELECTOR, "button.cs-load-more").get_attribute("data-page")
+                        != clicked_page
+                    )
+                )
 
             except TimeoutException:
                 retry_count += 1
@@ -330,42 +430,19 @@ class BandCrawler(BaseSeleniumCrawler):
             self.driver.get(link)
             time.sleep(5)
             self.scroll_page()
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            soup = clean_html(soup)
-            elements = soup.find_all("a", href=True)
+            elements = find_anchors(self.driver.page_source)
             hyperlinks = extract_links(elements)
 
             if len(hyperlinks) == 0:
                 logger.error("No links found.")
 
-            self.driver.close()
-
-            hyperlink_list = []
-            for hyperlink in hyperlinks:
-                try:
-                    hyperlink_list.append(
-                        Link(
-                            title=hyperlink["title"],
-                            url=hyperlink["url"],
-                            source=link,
-                            published_at=hyperlink["published_at"],
-                        )
-                    )
-                except ValueError:
-                    logger.error(
-                        "Failed to append hyperlink with title '%s' and URL '%s'",
-                        hyperlink.get("title", "N/A"),
-                        hyperlink.get("url", "N/A"),
-                    )
-                    continue
+            hyperlink_list = build_links(hyperlinks, source=link)
 
             logger.debug("Found %s hyperlinks on '%s'", len(hyperlink_list), link)
             self.model.bulk_insert(hyperlink_list)
         except Exception as ex:
             logger.error("Error while crawling domain %s: %s", link, ex)
             raise
-        finally:
-            self.driver.close()
 
 
 class R7Crawler(BaseSeleniumCrawler):
@@ -393,13 +470,7 @@ class R7Crawler(BaseSeleniumCrawler):
 
             try:
                 logger.debug("Scrolling page down.")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script(
-                        "return window.pageYOffset + window.innerHeight >= document.body.scrollHeight"
-                    )
-                )
+                scroll_to_bottom(self.driver)
 
                 logger.debug("Waiting for the button to be clickable.")
 
@@ -407,25 +478,27 @@ class R7Crawler(BaseSeleniumCrawler):
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "button.b-ultimas__btn"))
                 )
 
-                time.sleep(1)
-
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-
-                # Scroll the button into view
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", load_more_button)
-
                 if load_more >= self.scroll_limit:
                     logger.debug("Reached scrolls limit: %s", load_more)
                     break
 
                 logger.debug("Loading more content.")
-                self.driver.execute_script("arguments[0].click()", load_more_button)
+                # Bring the button into view, click it and read the height in a single round-trip
+                new_height = self.driver.execute_script(
+                    "arguments[0].scrollIntoView(true); arguments[0].click(); return document.body.scrollHeight;",
+                    load_more_button,
+                )
 
                 if new_height != last_height:
                     last_height = new_height
                     load_more += 1
 
-                time.sleep(2)
+                # Continue once the clicked batch has grown the page rather than after a fixed pause
+                WebDriverWait(self.driver, 10).until(
+                    lambda driver, clicked_height=new_height: (
+                        driver.execute_script("return document.body.scrollHeight") > clicked_height
+                    )
+                )
 
             except TimeoutException:
                 retry_count += 1
@@ -444,43 +517,19 @@ class R7Crawler(BaseSeleniumCrawler):
             # self.accept_cookies()
             # time.sleep(2)
             # self.scroll_page()
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            soup = clean_html(soup)
-            elements = soup.find_all("a", href=True)
+            elements = find_anchors(self.driver.page_source)
             hyperlinks = extract_links(elements)
 
             if len(hyperlinks) == 0:
                 logger.error("No links found.")
 
-            self.driver.close()
-
-            hyperlink_list = []
-
-            for hyperlink in hyperlinks:
-                try:
-                    hyperlink_list.append(
-                        Link(
-                            title=hyperlink["title"],
-                            url=hyperlink["url"],
-                            source=link,
-                            published_at=hyperlink["published_at"],
-                        )
-                    )
-                except ValueError:
-                    logger.error(
-                        "Failed to append hyperlink with title '%s' and URL '%s'",
-                        hyperlink.get("title", "N/A"),
-                        hyperlink.get("url", "N/A"),
-                    )
-                    continue
+            hyperlink_list = build_links(hyperlinks, source=link)
 
             logger.debug("Found %s hyperlinks on '%s'", len(hyperlink_list), link)
             self.model.bulk_insert(hyperlink_list)
         except Exception as ex:
             logger.error("Error while crawling domain %s: %s", link, ex)
             raise
-        finally:
-            self.driver.close()
 
     def accept_cookies(self):
         button = WebDriverWait(self.driver, 20).until(
@@ -519,12 +568,7 @@ class CNNBrasilCrawler(BaseSeleniumCrawler):
 
             try:
                 logger.debug("Scroll page down.")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script(
-                        "return window.pageYOffset + window.innerHeight >= document.body.scrollHeight"
-                    )
-                )
+                scroll_to_bottom(self.driver)
 
                 load_more_button = WebDriverWait(self.driver, 10).until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "button.block-list-get-more-btn"))
@@ -583,38 +627,16 @@ class CNNBrasilCrawler(BaseSeleniumCrawler):
             self.driver.get(link)
             WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "footer")))
             self.scroll_page()
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            soup = clean_html(soup)
-            elements = soup.find_all("a", href=True)
+            elements = find_anchors(self.driver.page_source)
             hyperlinks = extract_links(elements)
-            self.driver.close()
-
-            hyperlink_list = []
-            for hyperlink in hyperlinks:
-                try:
-                    hyperlink_list.append(
-                        Link(
-                            title=hyperlink["title"],
-                            url=hyperlink["url"],
-                            source=link,
-                            published_at=hyperlink["published_at"],
-                        )
-                    )
-                except ValueError:
-                    logger.error(
-                        "Failed to append hyperlink with title '%s' and URL '%s'",
-                        hyperlink.get("title", "N/A"),
-                        hyperlink.get("url", "N/A"),
-                    )
-                    continue
+
+            hyperlink_list = build_links(hyperlinks, source=link)
 
             logger.debug("Found %s hyperlinks on '%s'", len(hyperlink_list), link)
             self.model.bulk_insert(hyperlink_list)
         except Exception as ex:
             logger.error("Error while crawling domain %s: %s", link, ex)
             raise
-        finally:
-            self.driver.close()
 
 
 class BBCBrasilCrawler(BaseSeleniumCrawler):
@@ -644,13 +666,7 @@ class BBCBrasilCrawler(BaseSeleniumCrawler):
                 break
 
             try:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script(
-                        "return window.pageYOffset + window.innerHeight >= document.body.scrollHeight"
-                    )
-                )
+                scroll_to_bottom(self.driver)
 
                 logger.debug("Waiting for the button to be clickable.")
 
@@ -666,11 +682,8 @@ class BBCBrasilCrawler(BaseSeleniumCrawler):
                 # Extract the href value
                 href_value = next_page_element.get_attribute("href")
 
-                # Regular expression to extract the number
-                pattern = r"\?page=(\d+)"
-
-                # Search for the pattern in the href string
-                match = re.search(pattern, href_value)
+                # Search for the page number in the href string
+                match = _QUERY_PAGE_RE.search(href_value)
 
                 page_number = int(match.group(1))
 
@@ -724,38 +737,15 @@ class BBCBrasilCrawler(BaseSeleniumCrawler):
             site_elements = []
 
             for tab in tab_list:
-                soup = BeautifulSoup(tab, "html.parser")
-                soup = clean_html(soup)
-                elements = soup.find_all("a", href=True)
+                elements = find_anchors(tab)
                 site_elements.extend(elements)
 
             hyperlinks = extract_links(site_elements)
 
-            self.driver.close()
-
-            hyperlink_list = []
-            for hyperlink in hyperlinks:
-                try:
-                    hyperlink_list.append(
-                        Link(
-                            title=hyperlink["title"],
-                            url=hyperlink["url"],
-                            source=link,
-                            published_at=hyperlink["published_at"],
-                        )
-                    )
-                except ValueError:
-                    logger.error(
-                        "Failed to append hyperlink with title '%s' and URL '%s'",
-                        hyperlink.get("title", "N/A"),
-                        hyperlink.get("url", "N/A"),
-                    )
-                    continue
+            hyperlink_list = build_links(hyperlinks, source=link)
 
             logger.debug("Found %s hyperlinks on '%s'", len(hyperlink_list), link)
             self.model.bulk_insert(hyperlink_list)
         except Exception as ex:
             logger.error("Error while crawling domain %s: %s", link, ex)
             raise
-        finally:
-            self.driver.close()
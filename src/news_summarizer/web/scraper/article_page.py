@@ -49,16 +49,13 @@ class G1Scraper(BaseSeleniumScraper):
             logger.error("Value error scraping link %s: %s", article_link, ve)
         except InvalidSessionIdException as ise:
             logger.error("Invalid session while scraping link %s: %s", article_link, ise)
+            # The driver is reused for the next link, so let the executor replace the dead session
+            raise
         except HTTPError as ex:
             logger.error("HTTP error while scraping link %s: %s", article_link, ex)
         except Exception as ex:
             logger.error("Error while scraping link %s: %s", article_link, ex)
             raise  # Re-raise if you want to propagate the original exception
-        finally:
-            try:
-                self.driver.close()
-            except Exception as close_error:
-                logger.warning("Error closing the driver: %s", close_error)
 
     def _extract_title(self, soup: BeautifulSoup):
         try:
@@ -137,16 +134,13 @@ class R7Scraper(BaseSeleniumScraper):
             logger.error("Value error scraping link %s: %s", article_link, ve)
         except InvalidSessionIdException as ise:
             logger.error("Invalid session while scraping link %s: %s", article_link, ise)
+            # The driver is reused for the next link, so let the executor replace the dead session
+            raise
         except HTTPError as ex:
             logger.error("HTTP error while scraping link %s: %s", article_link, ex)
         except Exception as ex:
             logger.error("Error while scraping link %s: %s", article_link, ex)
             raise  # Re-raise if you want to propagate the original exception
-        finally:
-            try:
-                self.driver.close()
-            except Exception as close_error:
-                logger.warning("Error closing the driver: %s", close_error)
 
     def _extract_title(self, soup: BeautifulSoup):
         try:
@@ -240,16 +234,13 @@ class BandScraper(BaseSeleniumScraper):
             logger.error("Value error scraping link %s: %s", article_link, ve)
         except InvalidSessionIdException as ise:
             logger.error("Invalid session while scraping link %s: %s", article_link, ise)
+            # The driver is reused for the next link, so let the executor replace the dead session
+            raise
         except HTTPError as ex:
             logger.error("HTTP error while scraping link %s: %s", article_link, ex)
         except Exception as ex:
             logger.error("Error while scraping link %s: %s", article_link, ex)
             raise  # Re-raise if you want to propagate the original exception
-        finally:
-            try:
-                self.driver.close()
-            except Exception as close_error:
-                logger.warning("Error closing the driver: %s", close_error)
 
     def _extract_title(self, soup: BeautifulSoup):
         try:
@@ -366,16 +357,13 @@ class BBCBrasilScraper(BaseSeleniumScraper):
             logger.error("Value error scraping link %s: %s", article_link, ve)
         except InvalidSessionIdException as ise:
             logger.error("Invalid session while scraping link %s: %s", article_link, ise)
+            # The driver is reused for the next link, so let the executor replace the dead session
+            raise
         except HTTPError as ex:
             logger.error("HTTP error while scraping link %s: %s", article_link, ex)
         except Exception as ex:
             logger.error("Error while scraping link %s: %s", article_link, ex)
             raise  # Re-raise if you want to propagate the original exception
-        finally:
-            try:
-                self.driver.close()
-            except Exception as close_error:
-                logger.warning("Error closing the driver: %s", close_error)
 
     def _extract_title(self, soup: BeautifulSoup):
         try:
@@ -451,16 +439,13 @@ class CNNBrasilScraper(BaseSeleniumScraper):
             logger.error("Value error scraping link %s: %s", article_link, ve)
         except InvalidSessionIdException as ise:
             logger.error("Invalid session while scraping link %s: %s", article_link, ise)
+            # The driver is reused for the next link, so let the executor replace the dead session
+            raise
         except HTTPError as ex:
             logger.error("HTTP error while scraping link %s: %s", article_link, ex)
         except Exception as ex:
             logger.error("Error while scraping link %s: %s", article_link, ex)
             raise  # Re-raise if you want to propagate the original exception
-        finally:
-            try:
-                self.driver.close()
-            except Exception as close_error:
-                logger.warning("Error closing the driver: %s", close_error)
 
     def _extract_title(self, soup: BeautifulSoup):
         try:
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 
 from news_summarizer.domain.base import NoSQLBaseDocument
-from news_summarizer.webdriver import ShutilBrowserLocator, WebDriverFactory
+
+from ..base import webdriver_factory
 
 
 class BaseScraper(ABC):
@@ -11,8 +12,14 @@ class BaseScraper(ABC):
     def extract(self, link: str, **kwargs) -> None:
         raise NotImplementedError
 
+    def close(self) -> None:
+        return None
+
 
 class BaseSeleniumScraper(BaseScraper, ABC):
     def __init__(self) -> None:
-        self.driver = WebDriverFactory(ShutilBrowserLocator()).get_webdriver()
+        self.driver = webdriver_factory.get_webdriver()
         self.soup = None
+
+    def close(self) -> None:
+        self.driver.quit()
@@ -15,7 +15,7 @@ class ScraperExecutor(BaseExecutor):
 
     def _run(self, link: str) -> bool:
         logger.debug("Starting scraper for link: %s", link)
-        scraper = self.registry.get(link)
+        scraper = self._get_component(link)
         if not scraper:
             logger.error("No scraper registered for link: %s", link)
             return False
@@ -25,4 +25,5 @@ class ScraperExecutor(BaseExecutor):
             return True
         except Exception as ex:
             logger.error("Task failed: %s, %s", link, ex)
+            self._discard_component(link)
             return False
@@ -1,12 +1,19 @@
-from .creators import ChromeWebDriverCreator, EdgeWebDriverCreator, FirefoxWebDriverCreator
+from .creators import ChromeWebDriverCreator, EdgeWebDriverCreator, FirefoxWebDriverCreator, WebDriverCreator
 from .locators import BrowserLocator
 
 
 class WebDriverFactory:
     def __init__(self, browser_locator: BrowserLocator):
         self.browser_locator = browser_locator
+        self._creator = None
 
     def get_webdriver(self):
+        # Installed browsers don't change while running, so only search the PATH for the first driver
+        if self._creator is None:
+            self._creator = self._select_creator()
+        return self._creator.create_webdriver()
+
+    def _select_creator(self) -> WebDriverCreator:
         firefox_path = self.browser_locator.find_browser("firefox")
         edge_path = self.browser_locator.find_browser("microsoft-edge-stable")
         chrome_path = self.browser_locator.find_browser("google-chrome")
@@ -20,4 +27,4 @@ class WebDriverFactory:
         else:
             raise Exception("Neither Chrome nor Edge is installed. Please install one of them.")
 
-        return creator.create_webdriver()
+        return creator
@@ -0,0 +1,36 @@
+import warnings
+
+from news_summarizer.domain.dataset import (
+    PreferenceDataset,
+    PreferenceDatasetSample,
+    PreferenceDatasetTriplet,
+    SummaryDataset,
+    SummaryDatasetSample,
+)
+
+warnings.filterwarnings("ignore", category=DeprecationWarning, module="pydantic")
+
+
+def test_summary_dataset_to_hfdataset():
+    samples = [
+        SummaryDatasetSample(article="Primeiro artigo", summary="Resumo um"),
+        SummaryDatasetSample(article="Segundo artigo", summary="Resumo dois"),
+    ]
+    dataset = SummaryDataset(samples=samples)
+
+    hf_dataset = dataset.to_hfdataset()
+
+    assert hf_dataset.num_rows == 2
+    assert hf_dataset["article"] == ["Primeiro artigo", "Segundo artigo"]
+    assert hf_dataset["id"] == [str(sample.id) for sample in samples]
+
+
+def test_preference_dataset_iter_records():
+    triplet = PreferenceDatasetTriplet(instruction="Resuma", rejected="ruim", chosen="bom")
+    sample = PreferenceDatasetSample(article="Artigo", triplets=[triplet])
+    dataset = PreferenceDataset(samples=[sample])
+
+    records = list(dataset.iter_records())
+
+    assert records == [sample.model_dump()]
+    assert records[0]["triplets"][0]["chosen"] == "bom"
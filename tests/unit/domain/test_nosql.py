@@ -102,6 +102,17 @@ def test_bulk_insert(mock_database):
     assert len(found_links) == 5  # 3 from fixture + 2 new ones
 
 
+def test_bulk_insert_continues_past_duplicates(mock_database):
+    existing = DomainLink.find(name="Test Link 1")
+    links = [existing, DomainLink(name="Bulk Link 3", url="http://bulk3.com")]
+
+    success = DomainLink.bulk_insert(links)
+
+    assert not success
+    assert DomainLink.find(name="Bulk Link 3") is not None
+    assert len(mock_database["domain_link"].data) == 4
+
+
 def test_bulk_find(mock_database):
     # Test finding all links with a specific condition
     result = DomainLink.bulk_find(name="Test Link 1")
@@ -149,3 +160,10 @@ def test_save_cant_override_existing_id(mock_database):
     # The original document should be overwritten
     assert found_link["name"] != "Different Name"
     assert found_link["url"] != "http://other.com"
+
+
+def test_ensure_indexes(mock_database, monkeypatch):
+    monkeypatch.setattr(DomainLink.Config, "indexes", ["url"], raising=False)
+
+    assert DomainLink.ensure_indexes()
+    assert mock_database["domain_link"].indexes == {"url"}
@@ -1,6 +1,8 @@
 import uuid
 import warnings
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from news_summarizer.domain.base.vector import VectorBaseDocument
 from pydantic import Field
@@ -37,6 +39,15 @@ class MockDocument(VectorBaseDocument):
         use_vector_index = True
 
 
+class MockChunk(VectorBaseDocument):
+    document_id: str
+
+    class Config:
+        name = "mock_chunks"
+        use_vector_index = False
+        payload_indexes = ("document_id",)
+
+
 # Test cases
 def test_to_point():
     doc = MockDocument(id=uuid.uuid4(), embedding=[0.1, 0.2, 0.3])
@@ -98,7 +109,7 @@ def test_bulk_find(mock_database, monkeypatch):
 
     assert result
 
-    documents, next_offset = MockDocument.bulk_find(limit=3)
+    documents, next_offset = MockDocument.bulk_find(limit=3, with_vectors=True)
 
     assert len(documents) == 3
     assert type(next_offset) == uuid.UUID
@@ -106,6 +117,133 @@ def test_bulk_find(mock_database, monkeypatch):
     expected_embeddings = [0.3, 0.6, 0.2]
     assert documents[0].embedding == expected_embeddings
 
-    documents, next_offset = MockDocument.bulk_find(limit=2, offset=next_offset)
+    documents, next_offset = MockDocument.bulk_find(limit=2, offset=next_offset, with_vectors=True)
     assert len(documents) == 2
     assert type(next_offset) == uuid.UUID
+
+
+def test_find_existing_payload_values(mock_database):
+    assert MockChunk.find_existing_payload_values("document_id", ["a"]) == set()
+
+    assert MockChunk.bulk_insert([MockChunk(document_id=document_id) for document_id in ("a", "a", "b", "c")])
+
+    found = MockChunk.find_existing_payload_values("document_id", ["a", "c", "d"], batch_size=1)
+    assert found == {"a", "c"}
+
+
+def test_ensure_payload_indexes(mock_database):
+    assert MockChunk.ensure_payload_indexes()
+
+    assert MockChunk.bulk_insert([MockChunk(document_id="a")])
+    assert MockChunk.ensure_payload_indexes()
+    assert "document_id" in mock_database.get_collection("mock_chunks").payload_schema
+
+
+def test_ensure_vector_index(mock_database, monkeypatch):
+    update_collection = MagicMock(wraps=mock_database.update_collection)
+    monkeypatch.setattr(mock_database, "update_collection", update_collection)
+
+    assert MockDocument.ensure_vector_index()
+    assert MockDocument.ensure_vector_index()
+    update_collection.assert_called_once()
+
+    monkeypatch.setattr(MockDocument.Config, "use_vector_index", False)
+    assert not MockDocument.ensure_vector_index()
+
+
+def test_fake_search_matches_cosine_similarity(mock_database):
+    embeddings = [[0.3, 0.6, 0.2], [0.4, 0.1, 0.6], [0.2, 0.2, 0.5], [0.0, 0.0, 0.0], [0.8, 0.9, 0.3]]
+    documents = [MockDocument(embedding=embedding) for embedding in embeddings]
+    collection = mock_database.get_collection("mock_collection")
+    collection.upsert([document.to_point() for document in documents])
+
+    query = [0.5, 0.2, 0.4]
+    results = collection.search(query_vector=query, limit=3)
+
+    def cosine(a, b):
+        norm = np.linalg.norm(a) * np.linalg.norm(b)
+        return float(np.dot(a, b) / norm) if norm else 0.0
+
+    expected = sorted(embeddings, key=lambda embedding: cosine(embedding, query), reverse=True)[:3]
+    assert [result.vector for result in results] == expected
+    assert np.allclose([result.score for result in results], [cosine(e, query) for e in expected])
+
+
+def test_fake_search_grows_past_matrix_capacity(mock_database):
+    from news_summarizer.database.qdrant import SEARCH_MATRIX_CAPACITY
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.random((SEARCH_MATRIX_CAPACITY + 100, 3)).tolist()
+    documents = [MockDocument(embedding=embedding) for embedding in embeddings]
+    collection = mock_database.get_collection("mock_collection")
+    # Upsert in several calls so rows are written into an already allocated matrix before it grows
+    for start in range(0, len(documents), 300):
+        collection.upsert([document.to_point() for document in documents[start : start + 300]])
+
+    results = collection.search(query_vector=embeddings[-1], limit=1)
+
+    assert results[0].id == str(documents[-1].id)
+    assert np.isclose(results[0].score, 1.0)
+
+
+def test_fake_search_rebuilds_after_dimension_change(mock_database):
+    documents = [MockDocument(embedding=[0.3, 0.6, 0.2]), MockDocument(embedding=[0.4, 0.1, 0.6])]
+    collection = mock_database.get_collection("mock_collection")
+    collection.upsert([document.to_point() for document in documents])
+    assert collection.search(query_vector=[0.3, 0.6, 0.2], limit=1)[0].id == str(documents[0].id)
+
+    # Re-upserting with another dimension can't be written in place, so the matrix is rebuilt on search
+    for document, embedding in zip(documents, [[1.0, 0.0], [0.0, 1.0]], strict=True):
+        document.embedding = embedding
+    collection.upsert([document.to_point() for document in documents])
+
+    results = collection.search(query_vector=[0.1, 0.9], limit=2)
+
+    assert [result.id for result in results] == [str(documents[1].id), str(documents[0].id)]
+
+
+def test_fake_search_cache_is_cleared_on_upsert(mock_database):
+    documents = [MockDocument(embedding=[0.3, 0.6, 0.2]), MockDocument(embedding=[0.4, 0.1, 0.6])]
+    collection = mock_database.get_collection("mock_collection")
+    collection.upsert([document.to_point() for document in documents])
+    query = [0.4, 0.1, 0.6]
+    assert collection.search(query_vector=query, limit=1)[0].id == str(documents[1].id)
+
+    documents[0].embedding = query
+    documents[1].embedding = [0.3, 0.6, 0.2]
+    collection.upsert([document.to_point() for document in documents])
+
+    assert collection.search(query_vector=query, limit=1)[0].id == str(documents[0].id)
+
+
+def test_fake_search_cache_returns_fresh_points(mock_database):
+    collection = mock_database.get_collection("mock_collection")
+    collection.upsert([MockDocument(embedding=[0.3, 0.6, 0.2]).to_point()])
+
+    first = collection.search(query_vector=[0.3, 0.6, 0.2], limit=1)
+    first[0].score = -1.0
+    second = collection.search(query_vector=[0.3, 0.6, 0.2], limit=1)
+
+    assert second[0] is not first[0]
+    assert np.isclose(second[0].score, 1.0)
+
+
+def test_search(mock_database, monkeypatch):
+    documents = [
+        MockDocument(embedding=[0.3, 0.6, 0.2]),
+        MockDocument(embedding=[0.4, 0.1, 0.6]),
+        MockDocument(embedding=[0.2, 0.2, 0.5]),
+    ]
+
+    class MockEmbeddingModel:
+        def __init__(self):
+            self.embedding_size = 3
+
+    monkeypatch.setattr("news_summarizer.domain.base.vector.EmbeddingModel", MockEmbeddingModel)
+
+    assert MockDocument.bulk_insert(documents)
+
+    results = MockDocument.search(query_vector=[0.4, 0.1, 0.6], limit=2, with_vectors=True)
+
+    assert [result.id for result in results] == [documents[1].id, documents[2].id]
+    assert results[0].embedding == documents[1].embedding
@@ -0,0 +1,15 @@
+from news_summarizer.preprocessing.text import pipeline
+
+
+def test_pipeline_execute_cleans_text():
+    assert pipeline.execute("  Olá 😀   mundo™\n") == "Olá mundo"
+
+
+def test_pipeline_execute_handles_none():
+    assert pipeline.execute(None) == ""
+
+
+def test_pipeline_execute_many_matches_execute():
+    texts = ["  Notícia\n\ncom   espaços ", "Emoji 🚀 no título", None, "plain ascii"]
+
+    assert pipeline.execute_many(texts) == [pipeline.execute(text) for text in texts]
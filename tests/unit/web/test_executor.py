@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+
+from news_summarizer.web.base import BaseRegistry
+from news_summarizer.web.crawler.executor import CrawlerExecutor
+from news_summarizer.web.scraper.executor import ScraperExecutor
+
+
+def make_registry(crawler_class):
+    registry = BaseRegistry()
+    registry.register("https://example.com/", crawler_class)
+    return registry
+
+
+def test_run_reuses_crawler_per_host_and_closes_it():
+    crawler = MagicMock()
+    crawler_class = MagicMock(return_value=crawler)
+    executor = CrawlerExecutor(make_registry(crawler_class), max_concurrent_crawlers=1, max_workers=1)
+
+    results = executor.run(["https://example.com/a", "https://www.example.com/b"])
+
+    assert results == {"https://example.com/a": True, "https://www.example.com/b": True}
+    crawler_class.assert_called_once()
+    assert crawler.search.call_count == 2
+    crawler.close.assert_called_once()
+
+
+def test_run_replaces_crawler_after_failure():
+    broken, healthy = MagicMock(), MagicMock()
+    broken.search.side_effect = RuntimeError("session lost")
+    crawler_class = MagicMock(side_effect=[broken, healthy])
+    executor = CrawlerExecutor(make_registry(crawler_class), max_concurrent_crawlers=1, max_workers=1)
+
+    results = executor.run(["https://example.com/a", "https://example.com/b"])
+
+    assert results == {"https://example.com/a": False, "https://example.com/b": True}
+    assert crawler_class.call_count == 2
+    broken.close.assert_called_once()
+    healthy.close.assert_called_once()
+
+
+def test_run_consumes_lazy_links():
+    pulled, pulled_at_extract = [], []
+
+    def links():
+        for index in range(20):
+            pulled.append(index)
+            yield f"https://example.com/{index}"
+
+    scraper = MagicMock()
+    scraper.extract.side_effect = lambda link: pulled_at_extract.append(len(pulled))
+    executor = ScraperExecutor(make_registry(MagicMock(return_value=scraper)), max_concurrent_scrapers=1, max_workers=1)
+
+    results = executor.run(links())
+
+    assert len(results) == 20
+    assert all(results.values())
+    # One worker keeps at most two tasks queued, plus the link being pulled while it waits for a slot
+    assert all(count <= index + 3 for index, count in enumerate(pulled_at_extract))
+
+
+def test_run_crawls_each_host_with_a_single_crawler():
+    registry = BaseRegistry()
+    first_class, second_class = MagicMock(), MagicMock()
+    registry.register("https://example.com/", first_class)
+    registry.register("https://example.org/", second_class)
+    executor = CrawlerExecutor(registry, max_concurrent_crawlers=2, max_workers=2)
+
+    links = [f"https://example.{tld}/{index}" for index in range(4) for tld in ("com", "org")]
+    results = executor.run(links)
+
+    assert all(results[link] for link in links)
+    first_class.assert_called_once()
+    second_class.assert_called_once()
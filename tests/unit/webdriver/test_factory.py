@@ -71,3 +71,19 @@ def test_get_webdriver_no_browser(mock_browser_locator):
     # Act & Assert
     with pytest.raises(Exception, match="Neither Chrome nor Edge is installed. Please install one of them."):
         factory.get_webdriver()
+
+
+def test_get_webdriver_locates_browser_once(mock_browser_locator, mock_chrome_webdriver_creator):
+    # Arrange
+    mock_browser_locator.find_browser.side_effect = (
+        lambda browser: "/path/to/browser" if browser == "google-chrome" else None
+    )
+    factory = WebDriverFactory(mock_browser_locator)
+
+    # Act
+    factory.get_webdriver()
+    factory.get_webdriver()
+
+    # Assert
+    assert mock_browser_locator.find_browser.call_count == 3
+    assert mock_chrome_webdriver_creator.return_value.create_webdriver.call_count == 2